@@ -37,6 +37,18 @@ def parse_args():
         type=str, 
         help="MLflow tracking URI. If not provided, MLFLOW_TRACKING_URI environment variable is used."
     )
+    parser.add_argument(
+        "--max-batch-size", 
+        type=int, 
+        help="Maximum number of concurrent requests coalesced into one model call. "
+             "If not provided, PREDICT_MAX_BATCH_SIZE environment variable is used."
+    )
+    parser.add_argument(
+        "--max-wait-ms", 
+        type=float, 
+        help="Maximum time in milliseconds to wait for a prediction batch to fill up. "
+             "If not provided, PREDICT_MAX_WAIT_MS environment variable is used."
+    )
     parser.add_argument(
         "--reload", 
         action="store_true",
@@ -56,6 +68,12 @@ def main():
     if args.tracking_uri:
         os.environ["MLFLOW_TRACKING_URI"] = args.tracking_uri
     
+    if args.max_batch_size is not None:
+        os.environ["PREDICT_MAX_BATCH_SIZE"] = str(args.max_batch_size)
+    
+    if args.max_wait_ms is not None:
+        os.environ["PREDICT_MAX_WAIT_MS"] = str(args.max_wait_ms)
+    
     # Log startup information
     logger.info(f"Starting API server on {args.host}:{args.port}")
     if args.model_uri:
@@ -0,0 +1,170 @@
+# src/api/batching.py
+"""
+Dynamic micro-batching of concurrent prediction requests.
+"""
+import asyncio
+from typing import Callable, Optional
+import pandas as pd
+from src.api.metrics import PREDICT_BATCH_SIZE, PREDICT_QUEUE_WAIT
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 32
+DEFAULT_MAX_WAIT_MS = 5.0
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent prediction requests into a single model call.
+
+    Every request is queued together with a future. A background worker drains
+    up to `max_batch_size` requests, waiting at most `max_wait_ms` for the batch
+    to fill up, concatenates their frames, calls `predict_fn` once and scatters
+    the predictions back to the waiting callers.
+    """
+    def __init__(
+        self,
+        predict_fn: Callable[[pd.DataFrame], pd.Series],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            predict_fn: Function that returns a prediction Series indexed like its input.
+            max_batch_size: Maximum number of requests coalesced into one call.
+            max_wait_ms: Maximum time to wait for a batch to fill up, in milliseconds.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start the background worker on the running event loop."""
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+        logger.info(
+            f"Micro-batching enabled (max_batch_size={self.max_batch_size}, "
+            f"max_wait_ms={self.max_wait_ms})"
+        )
+
+    async def stop(self):
+        """Stop the background worker and fail any requests still queued."""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        while not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Prediction service is shutting down."))
+        self._worker = None
+        self._queue = None
+
+    async def predict(self, data: pd.DataFrame) -> pd.Series:
+        """
+        Queue a frame for prediction and wait for its share of the batch result.
+
+        Args:
+            data: DataFrame with the records of a single request
+
+        Returns:
+            A pandas Series with the predictions for this request only
+        """
+        if self._worker is None:
+            raise RuntimeError("MicroBatcher is not running. Call 'start' before 'predict'.")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        await self._queue.put((data, future, loop.time()))
+        return await future
+
+    async def _run(self):
+        """Collect batches from the queue until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait_ms / 1000
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            dispatched_at = loop.time()
+            PREDICT_BATCH_SIZE.observe(len(batch))
+            for _, _, enqueued_at in batch:
+                PREDICT_QUEUE_WAIT.observe(dispatched_at - enqueued_at)
+            try:
+                await self._process([(data, future) for data, future, _ in batch])
+            except asyncio.CancelledError:
+                for _, future, _ in batch:
+                    self._resolve(future, error=RuntimeError("Prediction service is shutting down."))
+                raise
+
+    async def _process(self, batch: list[tuple[pd.DataFrame, asyncio.Future]]):
+        """
+        Run the prediction for one batch and resolve the callers' futures.
+
+        The model is called in a worker thread so the event loop keeps
+        accepting requests (which queue up for the next batch) meanwhile.
+        """
+        # Only frames with identical columns are coalesced, so that a request
+        # never sees NaNs introduced by another request's schema.
+        groups: dict[tuple, list[tuple[pd.DataFrame, asyncio.Future]]] = {}
+        for data, future in batch:
+            if not future.cancelled():
+                groups.setdefault(tuple(data.columns), []).append((data, future))
+
+        for items in groups.values():
+            try:
+                results = await asyncio.to_thread(self._predict_group, [data for data, _ in items])
+            except Exception as e:
+                if len(items) == 1:
+                    self._resolve(items[0][1], error=e)
+                    continue
+                # Isolate the failing request(s) instead of failing the whole batch
+                logger.warning(f"Batched prediction failed ({e}), retrying requests individually")
+                for data, future in items:
+                    try:
+                        self._resolve(future, result=await asyncio.to_thread(self.predict_fn, data))
+                    except Exception as item_error:
+                        self._resolve(future, error=item_error)
+                continue
+            for (_, future), result in zip(items, results):
+                self._resolve(future, result=result)
+
+    def _predict_group(self, frames: list[pd.DataFrame]) -> list[pd.Series]:
+        """Predict a list of frames with a single call and split the result per frame."""
+        if len(frames) == 1:
+            return [self.predict_fn(frames[0])]
+
+        # The top-level key records which request every row belongs to.
+        combined = pd.concat(frames, keys=range(len(frames)))
+        predictions = self.predict_fn(combined)
+        if predictions.empty:
+            return [predictions] * len(frames)
+
+        parts = {key: part.droplevel(0) for key, part in predictions.groupby(level=0, sort=False)}
+        empty = predictions.iloc[:0].droplevel(0)
+        return [parts.get(i, empty) for i in range(len(frames))]
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, result: Optional[pd.Series] = None, error: Optional[Exception] = None):
+        """Set the outcome of a future unless the caller has already gone away."""
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
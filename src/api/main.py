@@ -2,24 +2,89 @@
 """
 FastAPI endpoint for model inference.
 """
+import asyncio
 import os
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+import numpy as np
 import pandas as pd
 import traceback
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
+from src.api.batching import MicroBatcher, DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT_MS
+from src.api.metrics import PREDICT_LATENCY
 from src.api.service import ModelService
 from src.api.schema import PredictionRequest, PredictionResponse
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Requests at least this large are converted to a DataFrame in a worker thread
+THREADED_PARSE_MIN_INSTANCES = 1000
+
+
+def _to_json_array(values: pd.Series | pd.Index):
+    """
+    Prepares a Series or Index for orjson. Numeric and boolean data is passed
+    as a NumPy array, which orjson serializes straight from the buffer; other
+    dtypes (e.g. string labels) fall back to a Python list.
+    """
+    array = values.to_numpy()
+    if array.dtype.kind in "biuf":
+        return np.ascontiguousarray(array)
+    return array.tolist()
+
+
+def _build_input_frame(app: FastAPI, payload: PredictionRequest) -> pd.DataFrame:
+    """
+    Converts the request to a DataFrame, using the model signature's column
+    types when the schema fast path is enabled and the records fit it.
+    """
+    if getattr(app.state, "schema_fast_path", False) and payload.instances:
+        input_df = app.state.model_service.records_to_frame(payload.instances)
+        if input_df is not None:
+            return input_df
+    return payload.to_dataframe()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Load the model once per worker and run the micro-batching worker for the
+    lifetime of the app.
+    """
+    # Loading the model may download artifacts, so keep it off the event loop
+    app.state.model_service = await asyncio.to_thread(ModelService)
+    # Build request frames straight from the model signature when enabled
+    app.state.schema_fast_path = os.environ.get("PREDICT_SCHEMA_FAST_PATH", "0") == "1"
+
+    def predict_batch(data: pd.DataFrame) -> pd.Series:
+        """Run the model on a (possibly coalesced) batch of requests."""
+        return app.state.model_service.predict(data)
+
+    # Coalesce concurrent requests into a single model call
+    app.state.batcher = MicroBatcher(
+        predict_batch,
+        max_batch_size=int(os.environ.get("PREDICT_MAX_BATCH_SIZE", DEFAULT_MAX_BATCH_SIZE)),
+        max_wait_ms=float(os.environ.get("PREDICT_MAX_WAIT_MS", DEFAULT_MAX_WAIT_MS)),
+    )
+    await app.state.batcher.start()
+    yield
+    await app.state.batcher.stop()
+    app.state.model_service = None
+
+
 # Initialize the FastAPI app
 app = FastAPI(
     title="Colony Strength Predictor API",
     description="API for predicting bee colony strength",
     version="0.1.0",
+    lifespan=lifespan,
+    # orjson serializes the large prediction lists much faster than stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware to allow cross-origin requests
@@ -31,9 +96,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize model service
-model_service = ModelService()
-
 
 @app.get("/health")
 async def health_check():
@@ -49,37 +111,67 @@ async def root():
         "version": "0.1.0",
         "endpoints": {
             "/predict": "Make predictions with the model",
-            "/health": "Check API health"
+            "/health": "Check API health",
+            "/metrics": "Prometheus metrics"
         }
     }
 
 
-@app.post("/predict", response_model=PredictionResponse)
-async def predict(request: PredictionRequest):
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Expose Prometheus metrics."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+@app.post(
+    "/predict",
+    response_model=PredictionResponse,
+    # The body is decoded manually, so document its schema explicitly
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": PredictionRequest.model_json_schema()}},
+        }
+    },
+)
+async def predict(request: Request):
     """
     Make predictions with the model.
     
     This endpoint accepts a list of feature records and returns predictions
     for each record along with their indices to maintain data alignment.
     """
+    started_at = time.perf_counter()
+    try:
+        payload = PredictionRequest.from_json(await request.body())
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid request body: {str(e)}")
+
     try:
         # Convert request data to DataFrame
-        input_df = request.to_dataframe()
+        if len(payload.instances) >= THREADED_PARSE_MIN_INSTANCES:
+            input_df = await asyncio.to_thread(_build_input_frame, request.app, payload)
+        else:
+            input_df = _build_input_frame(request.app, payload)
         
         if input_df.empty:
             raise HTTPException(status_code=400, detail="No instances provided")
             
         logger.info(f"Making predictions for {len(input_df)} instances")
         
-        # Get predictions
-        predictions = model_service.predict(input_df)
+        # Get predictions; concurrent requests are batched into one model call
+        predictions = await request.app.state.batcher.predict(input_df)
         
         # Create response with predictions and record IDs
         # Note: predictions may have fewer records than input if outliers were removed
-        return PredictionResponse(
-            predictions=predictions.tolist(),
-            record_ids=predictions.index.tolist()
-        )
+        # The response is built directly (matching PredictionResponse) so it is
+        # not re-validated by Pydantic on the way out.
+        response = ORJSONResponse({
+            "predictions": _to_json_array(predictions),
+            "record_ids": _to_json_array(predictions.index)
+        })
+        PREDICT_LATENCY.observe(time.perf_counter() - started_at)
+        return response
         
     except Exception as e:
         logger.error(f"Prediction error: {str(e)}\n{traceback.format_exc()}")
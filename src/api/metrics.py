@@ -0,0 +1,23 @@
+# src/api/metrics.py
+"""
+Prometheus metrics for the prediction API.
+"""
+from prometheus_client import Histogram
+
+PREDICT_LATENCY = Histogram(
+    "predict_latency_seconds",
+    "Time spent handling a /predict request, from body parsing to response.",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+PREDICT_BATCH_SIZE = Histogram(
+    "predict_batch_size",
+    "Number of requests coalesced into a single model call.",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
+)
+
+PREDICT_QUEUE_WAIT = Histogram(
+    "predict_queue_wait_seconds",
+    "Time a request waits in the micro-batching queue before its batch is dispatched.",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
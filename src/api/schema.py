@@ -2,11 +2,21 @@
 """
 Defines request and response schemas for the API.
 """
+from itertools import chain
+import msgspec
 from pydantic import BaseModel, Field, ConfigDict
 from typing import Dict, List, Optional, Any
 import pandas as pd
 
 
+class _PredictionPayload(msgspec.Struct):
+    """msgspec mirror of PredictionRequest, used to decode request bodies."""
+    instances: List[Dict[str, Any]]
+
+
+_payload_decoder = msgspec.json.Decoder(_PredictionPayload)
+
+
 class PredictionRequest(BaseModel):
     """
     Schema for prediction request data.
@@ -33,9 +43,47 @@ class PredictionRequest(BaseModel):
         }
     })
 
+    @classmethod
+    def from_json(cls, body: bytes) -> 'PredictionRequest':
+        """
+        Decodes a raw JSON request body into a PredictionRequest.
+
+        The structure is validated by msgspec while decoding, so the per-field
+        Pydantic validation is skipped on this hot path.
+
+        Raises:
+            msgspec.DecodeError: If the body is not valid JSON or does not
+                match the expected structure (a ValueError subclass).
+        """
+        payload = _payload_decoder.decode(body)
+        return cls.model_construct(instances=payload.instances)
+
     def to_dataframe(self) -> pd.DataFrame:
-        """Converts the request data to a pandas DataFrame for model input."""
-        return pd.DataFrame(self.instances)
+        """
+        Converts the request data to a pandas DataFrame for model input.
+
+        The records are ingested with PyArrow's columnar builder when it is
+        installed, which yields typed columns without a per-row pass in Python.
+        Falls back to the pandas constructor if PyArrow is missing or cannot
+        handle the payload (e.g. mixed types within a column).
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            return pd.DataFrame(self.instances)
+
+        try:
+            table = pa.Table.from_pylist(self.instances)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return pd.DataFrame(self.instances)
+
+        # Arrow infers the columns from the first record only, so records
+        # with extra keys need the pandas path to keep every column.
+        columns = dict.fromkeys(chain.from_iterable(self.instances))
+        if table.num_columns != len(columns):
+            return pd.DataFrame(self.instances)
+
+        return table.to_pandas(split_blocks=True, self_destruct=True)
 
 
 class PredictionResponse(BaseModel):
@@ -4,12 +4,22 @@ Model prediction service that loads models from MLflow and serves predictions.
 """
 import os
 import mlflow
-from typing import Optional
+from typing import Any, Dict, List, Optional
+import numpy as np
 import pandas as pd
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# MLflow issues its tracking/registry/artifact requests through a cached,
+# per-process keep-alive requests session whose pool and retry policy are read
+# from these variables. Defaults apply only when the deployment does not set them.
+MLFLOW_HTTP_DEFAULTS = {
+    "MLFLOW_HTTP_POOL_CONNECTIONS": "10",
+    "MLFLOW_HTTP_POOL_MAXSIZE": "32",
+    "MLFLOW_HTTP_REQUEST_MAX_RETRIES": "3",
+}
+
 
 class ModelService:
     """
@@ -30,7 +40,12 @@ class ModelService:
             model_uri: URI to the MLflow model. If None, will use environment variable.
             tracking_uri: URI to the MLflow tracking server. If None, will use environment variable.
         """
+        for name, value in MLFLOW_HTTP_DEFAULTS.items():
+            os.environ.setdefault(name, value)
+
         self.model = None
+        # (name, numpy dtype) per input column, taken from the model signature
+        self.input_columns: Optional[List[tuple]] = None
         self.model_uri = model_uri or os.environ.get("MODEL_URI")
         tracking_uri = tracking_uri or os.environ.get("MLFLOW_TRACKING_URI")
         
@@ -48,11 +63,58 @@ class ModelService:
         try:
             logger.info(f"Loading model from {self.model_uri}")
             self.model = mlflow.pyfunc.load_model(self.model_uri)
+            self.input_columns = self._read_input_columns(self.model)
             logger.info("Model loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load model: {str(e)}")
             raise
     
+    @staticmethod
+    def _read_input_columns(model) -> Optional[List[tuple]]:
+        """
+        Reads the expected input columns and their dtypes from the model signature.
+
+        Returns None if the model has no column-based signature.
+        """
+        try:
+            schema = model.metadata.get_input_schema()
+            if schema is None or not schema.has_input_names():
+                return None
+            return list(zip(schema.input_names(), schema.numpy_types()))
+        except Exception as e:
+            logger.warning(f"Could not read the model input schema: {str(e)}")
+            return None
+
+    def records_to_frame(self, records: List[Dict[str, Any]]) -> Optional[pd.DataFrame]:
+        """
+        Builds the model input directly from the signature's columns.
+
+        Each column is gathered into an array of the dtype the model expects,
+        so no per-record type inference is needed and the frame already
+        matches the signature that pyfunc enforces.
+
+        Args:
+            records: List of feature records, one dictionary per sample
+
+        Returns:
+            A DataFrame in signature column order, or None if the model has no
+            signature or the records do not fit it (missing keys, values that
+            cannot be cast safely). Callers should then use the generic path.
+        """
+        if self.input_columns is None:
+            return None
+
+        columns = {}
+        try:
+            for name, dtype in self.input_columns:
+                values = np.asarray([record[name] for record in records])
+                if not np.can_cast(values.dtype, dtype, casting="same_kind"):
+                    return None
+                columns[name] = values.astype(dtype, copy=False)
+        except (KeyError, TypeError, ValueError):
+            return None
+        return pd.DataFrame(columns, copy=False)
+
     def predict(self, data: pd.DataFrame) -> pd.Series:
         """
         Generate predictions for the input data.
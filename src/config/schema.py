@@ -6,7 +6,46 @@ from src.data.loader import DataLoaderConfig
 from src.data.preprocessor import PreprocessorStepConfig
 from src.data.outlier_remover import OutlierRemoverConfig
 from src.models.colony_classifier import ColonyStrengthClassifierConfig
-from typing import Any
+from typing import Any, Optional
+
+# Prefer the libyaml-backed C loader, falling back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Matches ${VAR_NAME} and ${VAR_NAME:-default_value} placeholders
+_ENV_VAR_PATTERN = re.compile(r'\$\{(\w+)(?::-([^}]+))?\}')
+
+# Parsed YAML documents per path, tagged with the file's (mtime_ns, size).
+# Only the raw parse is cached: environment variables are resolved and the
+# config is validated on every load.
+_yaml_cache: dict[str, tuple[tuple, Any]] = {}
+
+
+def _load_yaml(path: str) -> Any:
+    """
+    Parses a YAML file, reusing the previous result while the file is unchanged.
+
+    The file is read in binary mode so that libyaml handles the decoding.
+
+    Args:
+        path (str): The path to the YAML file.
+
+    Returns:
+        Any: The parsed document. It is shared between calls and must not be modified.
+    """
+    stat = os.stat(path)
+    key = os.path.abspath(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _yaml_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with open(path, 'rb') as f:
+        document = yaml.load(f, Loader=_YamlLoader)
+    _yaml_cache[key] = (version, document)
+    return document
 
 
 class TrainingConfig(BaseModel):
@@ -18,7 +57,16 @@ class TrainingConfig(BaseModel):
     )
     test_size: float = Field(default=0.2, ge=0.0, le=1.0)
     random_state: int = Field(default=42)
-    stratify: bool = Field(default=True)
+    stratify: bool = Field(
+        default=True,
+        description="Whether to stratify the train/test split by the target. Ignored when the "
+                    "classes are nearly balanced (see DataLoader.load_split)."
+    )
+    preprocessor_n_jobs: Optional[int] = Field(
+        default=None,
+        description="Threads used to transform large inputs (see FeaturesPreprocessor.PARALLEL_MIN_ROWS) "
+                    "in row chunks; None transforms them on the calling thread, -1 uses all cores."
+    )
 
 class EvaluationConfig(BaseModel):
     """Configuration for the evaluation step."""
@@ -65,9 +113,7 @@ class PipelineConfig(BaseModel):
         Returns:
             PipelineConfig: A validated configuration object.
         """
-        with open(path, 'r') as f:
-            config_dict = yaml.safe_load(f)
-
+        config_dict = _load_yaml(path)
         resolved_config = cls._resolve_env_vars(config_dict)
         return cls(**resolved_config)
 
@@ -84,14 +130,15 @@ class PipelineConfig(BaseModel):
         Returns:
             Any: The object with environment variables resolved.
         """
-        pattern = re.compile(r'\$\{(\w+)(?::-([^}]+))?\}')
-
         def resolve_string(value: str) -> str:
             """Replaces environment variable placeholders in the string with their values."""
+            if '$' not in value:
+                return value
+
             def replacer(match: re.Match) -> str:
                 var_name, default = match.groups()
                 return os.environ.get(var_name, default or '')
-            return pattern.sub(replacer, value)
+            return _ENV_VAR_PATTERN.sub(replacer, value)
 
         if isinstance(obj, dict):
             return {k: PipelineConfig._resolve_env_vars(v) for k, v in obj.items()}
@@ -1,29 +1,88 @@
 from typing import Protocol
 import pandas as pd
+from pandas._libs.parsers import STR_NA_VALUES
+from sklearn.model_selection import ShuffleSplit, StratifiedShuffleSplit
 from src.utils.logger import get_logger
 from .schema import DataLoaderConfig
 
 logger = get_logger(__name__)
 
+# A timestamp format that never matches a whole column, so that date-like
+# columns stay strings, exactly as pd.read_csv returns them.
+_NO_TIMESTAMP_PARSERS = ["%%"]
+
+# The strings pd.read_csv reads as missing by default ('', 'NA', 'NaN', 'null', ...).
+# Arrow only treats them as null in non-string columns unless told otherwise.
+_PANDAS_NA_VALUES = sorted(STR_NA_VALUES)
+
+# Largest ratio between the most and least frequent class for which the
+# classes count as balanced and a stratified split is not worth its cost.
+_BALANCED_CLASS_RATIO = 1.05
+
 # Interface for loader functions
 class LoaderStrategy(Protocol):
-    def __call__(self, path: str) -> pd.DataFrame:
+    def __call__(self, path: str, engine: str, dtype_backend: str) -> pd.DataFrame:
         ...
 
 # --- Concrete Strategies ---
-def _load_from_csv(path: str) -> pd.DataFrame:
-    """Loads data from a CSV file."""
-    logger.info(f"Loading data from CSV at {path}")
+def _read_kwargs(dtype_backend: str) -> dict:
+    """Keyword arguments selecting the dtype backend of the pandas readers."""
+    return {"dtype_backend": "pyarrow"} if dtype_backend == "pyarrow" else {}
+
+def _load_from_csv(path: str, engine: str, dtype_backend: str) -> pd.DataFrame:
+    """
+    Loads data from a CSV file.
+
+    With the 'pyarrow' engine the file is parsed by Arrow's multithreaded
+    reader and handed to pandas with minimal copying (none at all with the
+    'pyarrow' dtype backend). The 'pandas' engine, or a missing pyarrow
+    installation, uses pd.read_csv instead.
+    """
+    logger.info(f"Loading data from CSV at {path} (engine: {engine})")
     try:
-        return pd.read_csv(path)
+        if engine == "pyarrow":
+            try:
+                import pyarrow.csv as pacsv
+            except ImportError:
+                logger.warning("pyarrow is not installed, falling back to the pandas CSV parser.")
+            else:
+                convert_options = pacsv.ConvertOptions(
+                    null_values=_PANDAS_NA_VALUES,
+                    strings_can_be_null=True,
+                    timestamp_parsers=_NO_TIMESTAMP_PARSERS
+                )
+                table = pacsv.read_csv(path, convert_options=convert_options)
+                types_mapper = pd.ArrowDtype if dtype_backend == "pyarrow" else None
+                return table.to_pandas(split_blocks=True, self_destruct=True, types_mapper=types_mapper)
+        return pd.read_csv(path, **_read_kwargs(dtype_backend))
     except FileNotFoundError:
         logger.error(f"File not found at path: {path}")
         raise 
 
+def _load_from_parquet(path: str, engine: str, dtype_backend: str) -> pd.DataFrame:
+    """Loads data from a Parquet file. Parquet is always read with pyarrow."""
+    logger.info(f"Loading data from Parquet at {path}")
+    try:
+        return pd.read_parquet(path, engine="pyarrow", **_read_kwargs(dtype_backend))
+    except FileNotFoundError:
+        logger.error(f"File not found at path: {path}")
+        raise
+
+def _load_from_feather(path: str, engine: str, dtype_backend: str) -> pd.DataFrame:
+    """Loads data from a Feather (Arrow IPC) file."""
+    logger.info(f"Loading data from Feather at {path}")
+    try:
+        return pd.read_feather(path, **_read_kwargs(dtype_backend))
+    except FileNotFoundError:
+        logger.error(f"File not found at path: {path}")
+        raise
+
 class DataLoader:
     """Handles loading data from various sources using a strategy pattern."""
     _STRATEGIES: dict[str, LoaderStrategy] = {
         "csv": _load_from_csv,
+        "parquet": _load_from_parquet,
+        "feather": _load_from_feather,
     }
 
     def __init__(self, config: DataLoaderConfig):
@@ -52,4 +111,52 @@ class DataLoader:
             logger.error(error_msg)
             raise ValueError(error_msg)
         
-        return strategy(str(path))
\ No newline at end of file
+        return strategy(str(path), self.config.engine, self.config.dtype_backend)
+
+    def load_split(
+        self,
+        target_column: str,
+        test_size: float = 0.2,
+        random_state: int = 42,
+        stratify: bool = True
+    ) -> tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series]:
+        """
+        Loads the data and splits it into train and test sets.
+
+        Same split as sklearn's train_test_split with the same settings, except
+        that stratification is skipped when the classes are (nearly) balanced:
+        if the most frequent class is less than _BALANCED_CLASS_RATIO times as
+        common as the least frequent one, the rows are split as with
+        stratify=False.
+
+        The target is popped off the loaded frame instead of dropped into a
+        copy, only the row indices are drawn, and the full frame is released
+        as soon as both sides are selected, so at most one extra copy of the
+        data is alive at a time.
+
+        Args:
+            target_column: Name of the target column.
+            test_size: Fraction of the rows in the test set.
+            random_state: Seed of the shuffle.
+            stratify: Whether to preserve the class proportions of the target.
+                Ignored for (nearly) balanced classes, see above.
+
+        Returns:
+            Tuple of (X_train, X_test, y_train, y_test).
+        """
+        X = self.load_data()
+        y = X.pop(target_column)
+
+        if stratify:
+            counts = y.value_counts()
+            if len(counts) > 1 and counts.iloc[0] / counts.iloc[-1] < _BALANCED_CLASS_RATIO:
+                logger.debug("Classes are balanced, splitting without stratification.")
+                stratify = False
+
+        splitter_class = StratifiedShuffleSplit if stratify else ShuffleSplit
+        splitter = splitter_class(n_splits=1, test_size=test_size, random_state=random_state)
+        train_idx, test_idx = next(splitter.split(X, y))
+
+        X_train, X_test = X.iloc[train_idx], X.iloc[test_idx]
+        del X
+        return X_train, X_test, y.iloc[train_idx], y.iloc[test_idx]
\ No newline at end of file
@@ -6,8 +6,16 @@ class DataLoaderConfig(BaseModel):
     Configuration schema for the DataLoader.
 
     Attributes:
-        type: The type of the data source. Currently only 'csv' is supported.
+        type: The type of the data source: 'csv', 'parquet' or 'feather'.
         path: The path to the data file.
+        engine: The CSV parser to use. 'pyarrow' (default) uses Arrow's multithreaded
+            reader, 'pandas' uses the pandas C parser. Parquet and Feather files
+            are always read with pyarrow.
+        dtype_backend: The dtypes of the loaded columns. 'numpy' (default) gives the
+            usual NumPy dtypes, 'pyarrow' keeps the columns as Arrow-backed
+            pandas dtypes (e.g. 'double[pyarrow]') without converting them.
     """
-    type: Literal["csv"]
+    type: Literal["csv", "parquet", "feather"]
     path: FilePath
+    engine: Literal["pyarrow", "pandas"] = "pyarrow"
+    dtype_backend: Literal["numpy", "pyarrow"] = "numpy"
@@ -1,5 +1,6 @@
 from typing import Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from sklearn.exceptions import NotFittedError
 
@@ -8,6 +9,9 @@ from .schema import OutlierRemoverConfig
 
 logger = get_logger(__name__)
 
+# Largest integer group id for which a dense lookup table is built.
+_MAX_LOOKUP_GROUP_ID = 1_000_000
+
 class OutlierRemover:
     """
     Calculates group-wise statistics during 'fit' and uses them to filter
@@ -44,11 +48,65 @@ class OutlierRemover:
         if not all(col in X.columns for col in required_cols):
             raise ValueError(f"Input DataFrame must contain columns: {required_cols}")
 
-        self._group_means: pd.Series = X.groupby(self.config.group_by_column)[self.config.temperature_column].mean()
-        logger.info(f"Fit complete. Found means for {len(self._group_means)} groups.")
+        self._group_means: pd.Series = self._compute_group_means(X)
+
+        # The thresholds are fixed, so resolve which groups pass them once here
+        # and keep 'transform' to a single membership test.
+        within_thresholds = self._group_means.between(
+            self.config.min_temp_threshold, self.config.max_temp_threshold
+        )
+        self._allowed_groups: pd.Index = self._group_means.index[within_thresholds]
+        self._allowed_lookup = self._build_allowed_lookup(within_thresholds)
+        logger.info(f"Fit complete. Found means for {len(self._group_means)} groups, "
+                    f"{len(self._allowed_groups)} within thresholds.")
         
         return self
 
+    def _compute_group_means(self, X: pd.DataFrame) -> pd.Series:
+        """
+        Computes the mean temperature per group with a single pass of
+        np.bincount over the factorized group codes. Matches
+        'groupby(...).mean()': rows with a missing group are dropped and
+        missing temperatures are skipped.
+
+        Args:
+            X (pd.DataFrame): The training dataframe.
+
+        Returns:
+            pd.Series: The mean temperature, indexed by group.
+        """
+        codes, uniques = pd.factorize(X[self.config.group_by_column], sort=True)
+        temps = X[self.config.temperature_column].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        valid = (codes >= 0) & ~np.isnan(temps)
+        sums = np.bincount(codes[valid], weights=temps[valid], minlength=len(uniques))
+        counts = np.bincount(codes[valid], minlength=len(uniques))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+
+        index = pd.Index(uniques, name=self.config.group_by_column)
+        return pd.Series(means, index=index, name=self.config.temperature_column)
+
+    def _build_allowed_lookup(self, within_thresholds: pd.Series) -> Optional[np.ndarray]:
+        """
+        Builds a boolean table indexed by group id when the groups are small
+        non-negative integers, so 'transform' becomes a single array gather
+        instead of a hash lookup. The table has one extra trailing False slot
+        that unseen ids are mapped to.
+
+        Returns:
+            The lookup table, or None if the group ids are not suitable.
+        """
+        group_ids = self._group_means.index
+        if group_ids.empty or not _is_numpy_integer(group_ids.dtype):
+            return None
+        if group_ids.min() < 0 or group_ids.max() > _MAX_LOOKUP_GROUP_ID:
+            return None
+
+        lookup = np.zeros(int(group_ids.max()) + 2, dtype=bool)
+        lookup[group_ids.to_numpy()] = within_thresholds.to_numpy()
+        return lookup
+
     def transform(self, X: pd.DataFrame, y: Optional[pd.Series] = None) -> Tuple[pd.DataFrame, Optional[pd.Series]]:
         """
         Filters the dataframe X (and optionally y) by removing rows belonging
@@ -61,7 +119,8 @@ class OutlierRemover:
 
         Returns:
             Tuple[pd.DataFrame, Optional[pd.Series]]: A tuple containing the
-            transformed X and the (optionally) transformed y.
+            transformed X and the (optionally) transformed y. If no rows are
+            removed, the inputs are returned as they are, not copied.
         """
         if not hasattr(self, '_group_means'):
             raise NotFittedError("This DataCleaner instance is not fitted yet. Call 'fit' before transforming data.")
@@ -69,30 +128,24 @@ class OutlierRemover:
         logger.info("Transforming data: removing outliers based on fitted group means.")
         initial_rows = len(X)
 
-        # Create a temporary column with the group means for filtering
-        # We use a temporary name to avoid conflicts
-        mean_col_name = f"_temp_mean_{self.config.group_by_column}"
-        X_transformed = X.merge(
-            self._group_means.rename(mean_col_name),
-            left_on=self.config.group_by_column,
-            right_index=True,
-            how='left'
-        )
-        
-        # For groups in the transform set that were not in the fit set,
-        # we can either drop them or fill with a neutral value.
-        # Here, we fill with a value that will pass the filter, but dropping is also valid.
-        # A more robust approach might be to fill with the global mean.
-        # For simplicity, we'll let them be NaN and the filter will handle them.
-        
-        # Define the filter mask
-        mask = (
-            (X_transformed[mean_col_name] >= self.config.min_temp_threshold) &
-            (X_transformed[mean_col_name] <= self.config.max_temp_threshold)
-        )
-        
-        # Apply the mask
-        X_filtered = X_transformed[mask].drop(columns=[mean_col_name])
+        # Keep rows of groups whose learned mean is within the thresholds.
+        # Groups that were not seen during fit are filtered out as well.
+        groups = X[self.config.group_by_column]
+        lookup = getattr(self, '_allowed_lookup', None)
+        if lookup is not None and _is_numpy_integer(groups.dtype):
+            # Ids outside the table (negative or larger than any seen in fit)
+            # are clipped onto the trailing False slot.
+            ids = np.clip(groups.to_numpy(), -1, len(lookup) - 1)
+            mask = lookup[ids]
+        else:
+            mask = groups.isin(self._allowed_groups)
+
+        if mask.all():
+            # Nothing to remove (the common case at inference time): return the
+            # input itself rather than a filtered copy of every row.
+            X_filtered = X
+        else:
+            X_filtered = X.loc[mask]
         
         rows_removed = initial_rows - len(X_filtered)
         logger.info(f"Removed {rows_removed} rows ({rows_removed / initial_rows:.2%} of total).")
@@ -100,7 +153,10 @@ class OutlierRemover:
 
         if y is not None:
             # Align y with the filtered X using the index
-            y_filtered = y.loc[X_filtered.index]
+            if X_filtered is X and y.index.equals(X.index):
+                y_filtered = y
+            else:
+                y_filtered = y.loc[X_filtered.index]
             return X_filtered, y_filtered
         
         return X_filtered, None
@@ -117,4 +173,9 @@ class OutlierRemover:
             Tuple[pd.DataFrame, Optional[pd.Series]]: The transformed X and y.
         """
         self.fit(X)
-        return self.transform(X, y)
\ No newline at end of file
+        return self.transform(X, y)
+
+
+def _is_numpy_integer(dtype) -> bool:
+    """Whether the dtype is a plain NumPy integer (not nullable or Arrow-backed)."""
+    return isinstance(dtype, np.dtype) and dtype.kind in "iu"
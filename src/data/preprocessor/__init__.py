@@ -5,13 +5,15 @@ This package provides a configurable pipeline for feature engineering.
 
 Exposes:
 - FeaturesPreprocessor: The main pipeline orchestrator.
+- CachedPreprocessor: A FeaturesPreprocessor that reuses the output for repeated inputs.
 - PreprocessorStepConfig: The Pydantic model for configuring a pipeline step.
 - StepMetadataConfig: The Pydantic model for metadata about executed steps.
 """
-from .component import FeaturesPreprocessor
+from .component import CachedPreprocessor, FeaturesPreprocessor
 from .schema import PreprocessorStepConfig, StepMetadataConfig
 
 __all__ = [
+    "CachedPreprocessor",
     "FeaturesPreprocessor",
     "PreprocessorStepConfig",
     "StepMetadataConfig",
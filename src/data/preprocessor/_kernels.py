@@ -0,0 +1,108 @@
+"""
+Optional Numba kernels for the preprocessing hot paths.
+
+Numba is an optional dependency (the 'numba' extra). Every kernel has a
+NumPy fallback with the same result, so callers can use them unconditionally
+and check NUMBA_AVAILABLE only to decide whether the JIT path is worth it.
+
+The compiled kernels are cached on disk (cache=True, next to this module in
+__pycache__, or under NUMBA_CACHE_DIR if that is not writable), so only the
+first process after a code change pays the JIT compilation.
+
+The parallel kernels must not be called from several threads at once: with
+Numba's default 'workqueue' threading layer, concurrent calls can deadlock.
+Code that runs transforms on a thread pool wraps each task in
+numpy_kernels(), which makes the kernels use their NumPy fallback instead.
+"""
+import threading
+from contextlib import contextmanager
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+_thread_state = threading.local()
+
+
+@contextmanager
+def numpy_kernels():
+    """Makes the kernels use their NumPy fallback on the current thread."""
+    previous = getattr(_thread_state, 'numpy_only', False)
+    _thread_state.numpy_only = True
+    try:
+        yield
+    finally:
+        _thread_state.numpy_only = previous
+
+
+def _use_numba() -> bool:
+    """Whether the Numba kernels may run on the current thread."""
+    return NUMBA_AVAILABLE and not getattr(_thread_state, 'numpy_only', False)
+
+
+if NUMBA_AVAILABLE:
+    # fastmath is deliberately off: it lets the compiler assume there are no
+    # NaNs, which would break the isnan test.
+    @njit(parallel=True, cache=True)
+    def _fill_nan_columns_kernel(values, fill, out):
+        n_rows, n_cols = values.shape
+        for i in prange(n_rows):
+            for j in range(n_cols):
+                v = values[i, j]
+                out[i, j] = fill[j] if np.isnan(v) else v
+
+    @njit(parallel=True, cache=True)
+    def _subtract_kernel(a, b, absolute, out):
+        for i in prange(a.size):
+            d = a[i] - b[i]
+            out[i] = abs(d) if absolute else d
+
+
+def fill_nan_columns(values: np.ndarray, fill: np.ndarray) -> np.ndarray:
+    """
+    Replaces the NaNs in each column of a 2-D float array with that column's fill value.
+
+    Args:
+        values (np.ndarray): A 2-D float64 array, one column per feature.
+        fill (np.ndarray): The fill value for each column.
+
+    Returns:
+        np.ndarray: A new Fortran-ordered array, so that every column is contiguous.
+
+    Not safe to call from several threads at once when Numba is installed,
+    unless inside numpy_kernels().
+    """
+    out = np.empty(values.shape, dtype=np.float64, order='F')
+    if _use_numba():
+        _fill_nan_columns_kernel(values, fill, out)
+    else:
+        np.copyto(out, np.where(np.isnan(values), fill, values))
+    return out
+
+
+def subtract(a: np.ndarray, b: np.ndarray, absolute: bool = False) -> np.ndarray:
+    """
+    Computes a - b (or |a - b|) for two 1-D float64 arrays in a single pass.
+
+    Args:
+        a (np.ndarray): The minuend.
+        b (np.ndarray): The subtrahend, of the same length.
+        absolute (bool): Whether to return the absolute difference.
+
+    Returns:
+        np.ndarray: A new float64 array.
+
+    Not safe to call from several threads at once when Numba is installed,
+    unless inside numpy_kernels().
+    """
+    out = np.empty(a.shape, dtype=np.float64)
+    if _use_numba():
+        _subtract_kernel(a, b, absolute, out)
+    else:
+        np.subtract(a, b, out=out)
+        if absolute:
+            np.abs(out, out=out)
+    return out
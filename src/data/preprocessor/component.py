@@ -1,34 +1,45 @@
-import hashlib
-import inspect
-import importlib
+import functools
+import weakref
+from collections import OrderedDict
+from typing import Optional
+import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
 from sklearn.base import BaseEstimator, TransformerMixin
 
+from src.utils.imports import import_class
 from src.utils.logger import get_logger
-from .feature_store import FeatureTransformer
+from ._kernels import numpy_kernels
+from .feature_store import FeatureTransformer, class_source_hash
 from .schema import PreprocessorStepConfig, StepMetadataConfig
 
 logger = get_logger(__name__)
 
-def _create_transformer_from_config(config: PreprocessorStepConfig) -> FeatureTransformer:
+@functools.lru_cache(maxsize=None)
+def _resolve_class(class_path: str) -> type:
     """
-    Resolves the class path, imports, and instantiates a transformer from its config.
+    Resolves a (possibly short) class path to the transformer class.
+    Cached, so repeated fits do not repeat the import machinery.
     """
     DEFAULT_MODULE_PREFIX = "src.data.preprocessor." # Adjust if needed
-    class_path = config.class_path
-    if '.' in class_path and not class_path.startswith(DEFAULT_MODULE_PREFIX):
-        module_name = class_path.split('.')[0]
+    full_path = class_path
+    if '.' in full_path and not full_path.startswith(DEFAULT_MODULE_PREFIX):
+        module_name = full_path.split('.')[0]
         if module_name != "src":
-            class_path = f"{DEFAULT_MODULE_PREFIX}{class_path}"
-            logger.debug(f"Expanded short path '{config.class_path}' to '{class_path}'")
+            full_path = f"{DEFAULT_MODULE_PREFIX}{full_path}"
+            logger.debug(f"Expanded short path '{class_path}' to '{full_path}'")
 
     try:
-        module_path, class_name = class_path.rsplit('.', 1)
-        module = importlib.import_module(module_path)
-        transformer_class = getattr(module, class_name)
-    except (ImportError, AttributeError, ValueError) as e:
-        raise ImportError(f"Could not import class '{config.class_path}'.") from e
+        return import_class(full_path)
+    except ImportError as e:
+        raise ImportError(f"Could not import class '{class_path}'.") from e
+
 
+def _create_transformer_from_config(config: PreprocessorStepConfig) -> FeatureTransformer:
+    """
+    Resolves the class path, imports, and instantiates a transformer from its config.
+    """
+    transformer_class = _resolve_class(config.class_path)
     return transformer_class(**config.params)
 
 
@@ -36,9 +47,19 @@ class FeaturesPreprocessor(BaseEstimator, TransformerMixin):
     """
     Orchestrates a sequence of feature transformations based on a validated
     pipeline configuration. This class is a scikit-learn compatible transformer.
+
+    With 'n_jobs' set, large inputs are transformed in row chunks on a thread
+    pool. This is valid because every fitted step transforms each row
+    independently; the NumPy/pandas kernels release the GIL for most of it.
+    The chunks always use the NumPy code paths, as the parallel Numba kernels
+    are not safe to run from several threads at once.
     """
-    def __init__(self, steps: list[PreprocessorStepConfig]):
+    # Minimum number of rows for which 'transform' is split across threads
+    PARALLEL_MIN_ROWS = 100_000
+
+    def __init__(self, steps: list[PreprocessorStepConfig], n_jobs: Optional[int] = None):
         self.steps = steps
+        self.n_jobs = n_jobs
         logger.info("Initialized FeaturesPreprocessor with steps: %s", [step.name for step in steps])
 
     def fit(self, X: pd.DataFrame, y: pd.Series=None):
@@ -47,10 +68,26 @@ class FeaturesPreprocessor(BaseEstimator, TransformerMixin):
         output of the previous step's transformation. The 'y' parameter is
         ignored but included for compatibility with scikit-learn.
         """
+        self._fit(X)
+        return self
+
+    def fit_transform(self, X: pd.DataFrame, y: pd.Series=None, **fit_params) -> pd.DataFrame:
+        """
+        Fits all transformers and returns the transformed data. The output of
+        the last step during fitting already is the transformed data, so the
+        steps are not applied a second time.
+        """
+        return self._fit(X)
+
+    def _fit(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Fits all transformers sequentially and returns the final output."""
         logger.info("Fitting FeaturesPreprocessor...")
         self.fitted_steps_: list[FeaturesPreprocessor] = []
+        self._metadata_dicts = None
         
-        df_temp = X.copy()
+        # No defensive copy: transformers never modify their input in place
+        # and each step returns a new frame.
+        df_temp = X
 
         for step_config in self.steps:
             step_name = step_config.name
@@ -64,7 +101,7 @@ class FeaturesPreprocessor(BaseEstimator, TransformerMixin):
             df_temp = transformer.transform(df_temp)
 
         logger.info("FeaturesPreprocessor fitting complete.")
-        return self
+        return df_temp
 
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
         """
@@ -74,13 +111,30 @@ class FeaturesPreprocessor(BaseEstimator, TransformerMixin):
             raise RuntimeError("This preprocessor instance is not fitted yet. Call 'fit' before 'transform'.")
         
         logger.info("Transforming data using fitted FeaturesPreprocessor...")
-        df_current = X.copy()
+        n_chunks = min(effective_n_jobs(getattr(self, 'n_jobs', None)), len(X) // self.PARALLEL_MIN_ROWS)
+        if n_chunks > 1:
+            logger.info(f"  - Applying steps to {n_chunks} row chunks in parallel")
+            bounds = np.linspace(0, len(X), n_chunks + 1, dtype=int)
+            chunks = Parallel(n_jobs=n_chunks, backend="threading")(
+                delayed(self._transform_chunk)(X.iloc[start:stop])
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            )
+            return pd.concat(chunks, copy=False)
+
+        return self._apply_steps(X)
 
+    def _transform_chunk(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Applies the fitted steps to one row chunk on a worker thread."""
+        with numpy_kernels():
+            return self._apply_steps(X, log=False)
+
+    def _apply_steps(self, X: pd.DataFrame, log: bool = True) -> pd.DataFrame:
+        """Applies the fitted steps to X in sequence."""
+        df_current = X
         for step in self.fitted_steps_:
-            step_name = step.__class__.__name__
-            logger.info(f"  - Applying step: '{step_name}'")
+            if log:
+                logger.info(f"  - Applying step: '{step.__class__.__name__}'")
             df_current = step.transform(df_current)
-                
         return df_current
 
     def get_metadata(self) -> list[StepMetadataConfig]:
@@ -90,14 +144,88 @@ class FeaturesPreprocessor(BaseEstimator, TransformerMixin):
 
         metadata_list = []
         for config, step_instance in zip(self.steps, self.fitted_steps_):
-            source_code = inspect.getsource(step_instance.__class__)
-            class_hash = hashlib.sha256(source_code.encode('utf-8')).hexdigest()
-            
             metadata = StepMetadataConfig(
                 name=config.name,
                 class_path=config.class_path,
                 params=config.params,
-                source_hash=class_hash
+                source_hash=class_source_hash(step_instance.__class__)
             )
             metadata_list.append(metadata)
-        return metadata_list
\ No newline at end of file
+        return metadata_list
+
+    def get_metadata_dicts(self) -> list[dict]:
+        """
+        Returns the step metadata as plain dictionaries, e.g. for a JSON artifact.
+
+        The dictionaries are built once per fit and then reused; callers must
+        not modify them.
+        """
+        if getattr(self, '_metadata_dicts', None) is None:
+            self._metadata_dicts = [metadata.model_dump() for metadata in self.get_metadata()]
+        return self._metadata_dicts
+
+
+class CachedPreprocessor(FeaturesPreprocessor):
+    """
+    A FeaturesPreprocessor that remembers its output for the most recently
+    transformed inputs, so transforming the same DataFrame again (e.g. across
+    training retries or CV folds) skips the whole sequence of steps.
+
+    Entries are keyed on the identity of the input frame and are dropped when
+    that frame is garbage collected or the preprocessor is refitted. Inputs
+    must therefore not be modified in place between calls. The cache is not
+    pickled.
+    """
+    def __init__(self, steps: list[PreprocessorStepConfig], cache_size: int = 1, n_jobs: Optional[int] = None):
+        super().__init__(steps, n_jobs=n_jobs)
+        self.cache_size = cache_size
+
+    def fit(self, X: pd.DataFrame, y: pd.Series=None):
+        self._clear_cache()
+        return super().fit(X, y)
+
+    def fit_transform(self, X: pd.DataFrame, y: pd.Series=None, **fit_params) -> pd.DataFrame:
+        self._clear_cache()
+        result = super().fit_transform(X, y, **fit_params)
+        self._store(X, result)
+        return result
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        entry = self._get_cache().get(id(X))
+        if entry is not None and entry[0]() is X:
+            logger.info("Reusing cached FeaturesPreprocessor output.")
+            self._cache.move_to_end(id(X))
+            return entry[1]
+
+        result = super().transform(X)
+        self._store(X, result)
+        return result
+
+    def _get_cache(self) -> OrderedDict:
+        """Returns the cache, creating it after unpickling or on first use."""
+        if getattr(self, '_cache', None) is None:
+            self._cache = OrderedDict()
+        return self._cache
+
+    def _clear_cache(self):
+        self._get_cache().clear()
+
+    def _store(self, X: pd.DataFrame, result: pd.DataFrame):
+        """Caches 'result' for 'X', evicting the least recently used entries."""
+        if self.cache_size < 1:
+            return
+        cache = self._get_cache()
+        key = id(X)
+        # Drop the entry as soon as the input frame goes away, so that a new
+        # object reusing the same id can never hit it.
+        cache[key] = (weakref.ref(X, lambda _, key=key: cache.pop(key, None)), result)
+        cache.move_to_end(key)
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    def __getstate__(self):
+        # BaseEstimator returns the instance's own __dict__; copy it so that
+        # pickling does not drop the cache of the live object.
+        state = dict(super().__getstate__())
+        state.pop('_cache', None)
+        return state
@@ -1,18 +1,94 @@
+import functools
+import hashlib
+import inspect
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
+from pandas.api.extensions import take
 from sklearn.base import BaseEstimator, TransformerMixin
 
+from ._kernels import NUMBA_AVAILABLE, fill_nan_columns, subtract
+
+# Minimum number of rows for which _difference uses the Numba kernel
+DIFFERENCE_NUMBA_MIN_ROWS = 100_000
+
+@functools.lru_cache(maxsize=None)
+def class_source_hash(cls: type) -> str:
+    """
+    Fingerprints a transformer class by its source code. A 128-bit BLAKE2b
+    digest is plenty for this; the result is cached per class, as reading
+    the source is the expensive part.
+    """
+    source_code = inspect.getsource(cls)
+    return hashlib.blake2b(source_code.encode('utf-8'), digest_size=16).hexdigest()
+
+def _greater_flag(values: pd.Series, threshold: float) -> np.ndarray:
+    """
+    Returns a 0/1 uint8 flag of values > threshold (NaN compares as 0).
+    One byte per row instead of int64's eight; for NumPy columns the
+    comparison is written straight into the uint8 result buffer.
+    """
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in "biuf":
+        out = np.empty(len(values), dtype=np.uint8)
+        np.greater(values.to_numpy(), threshold, out=out.view(np.bool_))
+        return out
+    flags = np.greater(values.to_numpy(), threshold)
+    if flags.dtype == np.bool_:
+        return flags.view(np.uint8)
+    return flags.astype(np.uint8)
+
+def _difference(a: pd.Series, b: pd.Series, absolute: bool = False):
+    """
+    Returns a - b (or |a - b|) for two columns of the same frame.
+
+    Plain NumPy columns are subtracted directly into a single result buffer,
+    which the absolute value then reuses, skipping the Series index alignment.
+    Extension dtypes (nullable, Arrow-backed) keep the pandas arithmetic so
+    their dtype and missing-value semantics are preserved. Large float64
+    columns go through the fused Numba kernel when it is installed.
+    """
+    if (NUMBA_AVAILABLE and len(a) >= DIFFERENCE_NUMBA_MIN_ROWS
+            and a.dtype == np.float64 and b.dtype == np.float64):
+        return subtract(a.to_numpy(), b.to_numpy(), absolute=absolute)
+    if isinstance(a.dtype, np.dtype) and isinstance(b.dtype, np.dtype):
+        out = np.subtract(a.to_numpy(), b.to_numpy())
+        if absolute:
+            np.abs(out, out=out)
+        return out
+    diff = a - b
+    return abs(diff) if absolute else diff
+
 class FeatureTransformer(BaseEstimator, TransformerMixin, ABC):
     """
     Abstract base class that defines the contract for all
     feature transformers in the pipeline. It is scikit-learn compatible.
+
+    Transformers must not modify their input in place; 'transform' returns
+    a new DataFrame, or the input itself if there is nothing to change.
+    The FeaturesPreprocessor relies on this to pass frames between steps
+    without copying them.
     """
     def _validate_columns(self, df: pd.DataFrame, required_cols: list[str]):
         """Helper to check for presence of required columns."""
-        missing = set(required_cols) - set(df.columns)
+        # Membership tests go through the Index's cached hash table, so no
+        # set of all the frame's columns is built on every call.
+        missing = [col for col in required_cols if col not in df.columns]
         if missing:
             raise ValueError(f"'{self.__class__.__name__}' is missing required columns: {missing}")
 
+    @staticmethod
+    def _with_columns(df: pd.DataFrame, columns: dict) -> pd.DataFrame:
+        """
+        Returns a new DataFrame with the given columns added or replaced.
+
+        Only the assigned columns are allocated: the result is a shallow copy
+        that shares the untouched columns with 'df', which is left unmodified.
+        """
+        df_out = df.copy(deep=False)
+        for name, values in columns.items():
+            df_out[name] = values
+        return df_out
+
     @abstractmethod
     def fit(self, X: pd.DataFrame, y=None):
         """
@@ -30,52 +106,73 @@ class FeatureTransformer(BaseEstimator, TransformerMixin, ABC):
 
 class IntToFloatConverter(FeatureTransformer):
     """
-    Converts specified integer columns to float64 type.
+    Converts specified integer columns to a float type (float64 by default).
     This is useful for making model signatures more robust to potential
     missing values at inference time.
     """
-    def __init__(self, columns: list[str] = None):
+    def __init__(self, columns: list[str] = None, dtype: str = 'float64'):
         """
         Args:
             columns (list[str], optional): A list of columns to convert.
                                            If None, all integer columns will be converted.
                                            Defaults to None.
+            dtype (str, optional): The float type to convert to, e.g. 'float32'
+                                   to halve the memory of the converted columns.
+                                   Defaults to 'float64'.
         """
         self.columns = columns
+        self.dtype = dtype
         self.columns_to_convert_ = []
 
     def fit(self, X: pd.DataFrame, y=None):
         """
         Identifies the integer columns to be converted.
         """
+        if np.dtype(self.dtype).kind != 'f':
+            raise ValueError(f"'{self.__class__.__name__}' can only convert to a float dtype, got '{self.dtype}'")
+
         if self.columns:
             # Use user-specified columns
             self._validate_columns(X, self.columns)
             self.columns_to_convert_ = self.columns
         else:
-            # Automatically find all integer columns
-            self.columns_to_convert_ = X.select_dtypes(
-                include=['int', 'int32', 'int64']
-            ).columns.tolist()
+            # Automatically find all integer columns, whether NumPy, nullable
+            # or Arrow-backed
+            self.columns_to_convert_ = [
+                col for col, dtype in X.dtypes.items() if pd.api.types.is_integer_dtype(dtype)
+            ]
         return self
 
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
         """
         Applies the type conversion to the identified columns.
         """
-        X_out = X.copy()
-        if not self.columns_to_convert_:
-            # This can happen if fit was called on data with no integers
-            # and no columns were specified.
-            return X_out
-
-        for col in self.columns_to_convert_:
-            if col in X_out.columns:
-                X_out[col] = X_out[col].astype('float64')
-        return X_out
+        # The list can be empty if fit was called on data with no integers
+        # and no columns were specified.
+        # Instances pickled before 'dtype' existed always converted to float64
+        dtype = np.dtype(getattr(self, 'dtype', 'float64'))
+        # Columns that already have the target dtype are left as they are
+        to_convert = [col for col in self.columns_to_convert_ if col in X.columns and X[col].dtype != dtype]
+        if not to_convert:
+            return X
+        # NumPy columns are cast straight from their array, which skips the
+        # pandas astype machinery; extension dtypes keep Series.astype.
+        converted = {
+            col: X[col].to_numpy(dtype=dtype) if isinstance(X[col].dtype, np.dtype) else X[col].astype(dtype)
+            for col in to_convert
+        }
+        return self._with_columns(X, converted)
 
 class MeanImputer(FeatureTransformer):
-    """Fills missing values in specified columns with their learned means."""
+    """
+    Fills missing values in specified columns with their learned means.
+
+    Large all-float inputs are filled with a parallel Numba kernel when Numba
+    is installed; smaller ones use pandas, where the JIT call is not worth it.
+    """
+    # Minimum number of rows for which the Numba kernel is used
+    NUMBA_MIN_ROWS = 100_000
+
     def __init__(self, input_cols: list[str]):
         self.input_cols = input_cols
         self.imputation_values_ = {}
@@ -87,8 +184,25 @@ class MeanImputer(FeatureTransformer):
         return self
 
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
-        X_out = X.copy()
-        return X_out.fillna(self.imputation_values_)
+        if NUMBA_AVAILABLE and len(X) >= self.NUMBA_MIN_ROWS and self._all_float(X):
+            cols = list(self.imputation_values_)
+            fill = np.array([self.imputation_values_[col] for col in cols], dtype=np.float64)
+            filled = fill_nan_columns(X[cols].to_numpy(dtype=np.float64), fill)
+            return self._with_columns(X, {col: filled[:, j] for j, col in enumerate(cols)})
+
+        # Only the columns that actually contain missing values are rewritten
+        filled = {
+            col: X[col].fillna(value)
+            for col, value in self.imputation_values_.items()
+            if col in X.columns and X[col].hasnans
+        }
+        return self._with_columns(X, filled)
+
+    def _all_float(self, X: pd.DataFrame) -> bool:
+        """Whether every imputed column is present in X as a float64 column."""
+        return bool(self.imputation_values_) and all(
+            col in X.columns and X[col].dtype == np.float64 for col in self.imputation_values_
+        )
 
 class GroupedAggregator(FeatureTransformer):
     """Calculates aggregations and merges them back into the DataFrame."""
@@ -102,7 +216,8 @@ class GroupedAggregator(FeatureTransformer):
     def fit(self, X: pd.DataFrame, y=None):
         self._validate_columns(X, self.input_cols + [self.groupby_col])
         agg_cols = list(self.aggregations.keys())
-        self.agg_df_ = X.groupby(self.groupby_col)[agg_cols].agg(self.aggregations)
+        # The aggregates are looked up by key, so the groups need no sorting
+        self.agg_df_ = X.groupby(self.groupby_col, sort=False, observed=True)[agg_cols].agg(self.aggregations)
         self.agg_df_.columns = self.output_cols
         return self
 
@@ -111,13 +226,16 @@ class GroupedAggregator(FeatureTransformer):
         if any(col in X.columns for col in self.output_cols):
             raise ValueError(f"'{self.__class__.__name__}' would overwrite existing columns: {self.output_cols}")
         
-        X_out = X.merge(
-            self.agg_df_, 
-            left_on=self.groupby_col, 
-            right_index=True, 
-            how='left'
-        )
-        return X_out
+        # Resolve each row's group position once through the hash table of the
+        # fitted index (built on first use and reused across calls), then
+        # gather every aggregate column with it. Groups unseen during fit get
+        # NaN, as with a left merge.
+        positions = self.agg_df_.index.get_indexer(X[self.groupby_col])
+        gathered = {
+            col: take(self.agg_df_[col].to_numpy(), positions, allow_fill=True)
+            for col in self.agg_df_.columns
+        }
+        return self._with_columns(X, gathered)
 
 class ColumnSubtractor(FeatureTransformer):
     """Creates a new column by subtracting one from another."""
@@ -136,9 +254,7 @@ class ColumnSubtractor(FeatureTransformer):
         if self.output_col in X.columns:
             raise ValueError(f"'{self.__class__.__name__}' would overwrite existing columns: {self.output_col}")
 
-        X_out = X.copy()
-        X_out[self.output_col] = X_out[self.col_a] - X_out[self.col_b]
-        return X_out
+        return self._with_columns(X, {self.output_col: _difference(X[self.col_a], X[self.col_b])})
 
 class AbsoluteDifference(FeatureTransformer):
     """Creates a new column with the absolute difference between two columns."""
@@ -156,13 +272,11 @@ class AbsoluteDifference(FeatureTransformer):
         self._validate_columns(X, self.input_cols)
         if self.output_col in X.columns:
             raise ValueError(f"'{self.__class__.__name__}' would overwrite existing columns: {self.output_col}")
-            
-        X_out = X.copy()
-        X_out[self.output_col] = abs(X_out[self.col_a] - X_out[self.col_b])
-        return X_out
+
+        return self._with_columns(X, {self.output_col: _difference(X[self.col_a], X[self.col_b], absolute=True)})
 
 class ThresholdBinarizer(FeatureTransformer):
-    """Creates a binary flag (0/1) if a column value is greater than a threshold."""
+    """Creates a binary uint8 flag (0/1) if a column value is greater than a threshold."""
     def __init__(self, input_col: str, output_col: str, threshold: float):
         self.input_col = input_col
         self.output_col = output_col
@@ -177,6 +291,58 @@ class ThresholdBinarizer(FeatureTransformer):
         if self.output_col in X.columns:
             raise ValueError(f"'{self.__class__.__name__}' would overwrite existing columns: {self.output_col}")
 
-        X_out = X.copy()
-        X_out[self.output_col] = (X_out[self.input_col] > self.threshold).astype(int)
-        return X_out
\ No newline at end of file
+        return self._with_columns(X, {self.output_col: _greater_flag(X[self.input_col], self.threshold)})
+
+class ArithmeticFeaturesTransformer(FeatureTransformer):
+    """
+    Computes several simple arithmetic features in a single step.
+
+    Equivalent to chaining ColumnSubtractor, AbsoluteDifference and
+    ThresholdBinarizer steps, but every feature is computed straight from the
+    underlying NumPy arrays and all outputs are appended to the frame at once.
+    """
+    OPERATIONS = ("subtract", "abs_diff", "greater")
+
+    def __init__(self, features: list[dict]):
+        """
+        Args:
+            features (list[dict]): The features to compute, in order. Each entry
+                has an 'op' ('subtract' for col_a - col_b, 'abs_diff' for
+                |col_a - col_b|, 'greater' for a 0/1 flag of col_a > threshold),
+                'col_a', 'output_col', and either 'col_b' or 'threshold'.
+        """
+        self.features = features
+
+    def _required_columns(self) -> list[str]:
+        """Returns the input columns used by the features."""
+        required = []
+        for feature in self.features:
+            op = feature.get("op")
+            if op not in self.OPERATIONS:
+                raise ValueError(
+                    f"'{self.__class__.__name__}' got unsupported op '{op}', expected one of {self.OPERATIONS}"
+                )
+            required.append(feature["col_a"])
+            if op != "greater":
+                required.append(feature["col_b"])
+        return required
+
+    def fit(self, X: pd.DataFrame, y=None):
+        self._validate_columns(X, self._required_columns())
+        return self # Stateless
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        self._validate_columns(X, self._required_columns())
+        output_cols = [feature["output_col"] for feature in self.features]
+        if any(col in X.columns for col in output_cols):
+            raise ValueError(f"'{self.__class__.__name__}' would overwrite existing columns: {output_cols}")
+
+        derived = {}
+        for feature in self.features:
+            if feature["op"] == "greater":
+                derived[feature["output_col"]] = _greater_flag(X[feature["col_a"]], feature["threshold"])
+                continue
+            derived[feature["output_col"]] = _difference(
+                X[feature["col_a"]], X[feature["col_b"]], absolute=feature["op"] == "abs_diff"
+            )
+        return self._with_columns(X, derived)
@@ -31,4 +31,4 @@ class StepMetadataConfig(BaseModel):
     name: str = Field(description="The unique name of the step from the config.")
     class_path: str = Field(description="The import path used to load the transformer class.")
     params: dict[str, Any] = Field(description="The parameters used to initialize the transformer.")
-    source_hash: str = Field(description="A SHA256 hash of the transformer class's source code for versioning.")
+    source_hash: str = Field(description="A BLAKE2b (128-bit) hash of the transformer class's source code for versioning.")
@@ -10,19 +10,33 @@ def evaluate_model(
     y_test: pd.Series,
     metrics_to_compute: List[str]
 ) -> Dict[str, Any]:
-    """Evaluates the final, wrapped PyFunc model on raw test data."""
+    """
+    Evaluates the final, wrapped PyFunc model on raw test data.
+
+    Besides the metrics and artifacts, the result holds the first few
+    predictions under 'head_predictions', so callers that need a sample of
+    the model output (e.g. for a signature) do not have to predict again.
+    """
     # Step 1: Get predictions. This now returns a pandas Series with the correct index.
     predictions: pd.Series = model.predict(context=None, model_input=X_test)
 
-    # Step 2: Align y_test with the predictions. This now works perfectly.
-    y_test_aligned = y_test.loc[predictions.index]
+    # Step 2: Align y_test with the predictions. Nothing to align when no rows
+    # were filtered out, which is the common case.
+    if y_test.index.equals(predictions.index):
+        y_test_aligned = y_test
+    else:
+        y_test_aligned = y_test.loc[predictions.index]
+
+    # The metrics work on plain arrays; convert once instead of per metric.
+    y_true = y_test_aligned.to_numpy()
+    y_pred = predictions.to_numpy()
 
     scalar_metrics = {}
     artifacts = {}
 
     if "accuracy" in metrics_to_compute:
-        scalar_metrics["accuracy"] = accuracy_score(y_test_aligned, predictions)
+        scalar_metrics["accuracy"] = accuracy_score(y_true, y_pred)
     if "f1_macro" in metrics_to_compute:
-        scalar_metrics["f1_macro"] = f1_score(y_test_aligned, predictions, average="macro")
+        scalar_metrics["f1_macro"] = f1_score(y_true, y_pred, average="macro")
 
-    return {"metrics": scalar_metrics, "artifacts": artifacts}
\ No newline at end of file
+    return {"metrics": scalar_metrics, "artifacts": artifacts, "head_predictions": predictions.head()}
\ No newline at end of file
@@ -1,16 +1,20 @@
 from typing import Dict, Any
+import inspect
 from sklearn.base import BaseEstimator, ClassifierMixin
 from sklearn.utils.validation import check_is_fitted
+from src.utils.imports import import_class
 from src.utils.logger import get_logger
 from pydantic import BaseModel, Field
-import importlib
 import pandas as pd
 
 logger = get_logger(__name__)
 
+# Estimators that support it are trained on all cores unless configured otherwise
+DEFAULT_N_JOBS = -1
+
 class ColonyStrengthClassifierConfig(BaseModel):
     """Configuration for the model algorithm itself."""
-    model_class_path: str = Field(default="sklearn.ensemble.RandomForestClassifier")
+    model_class_path: str = Field(default="sklearn.ensemble.HistGradientBoostingClassifier")
     hyperparameters: Dict[str, Any] = Field(default_factory=dict)
 
 class ColonyStrengthClassifier(BaseEstimator, ClassifierMixin):
@@ -23,15 +27,16 @@ class ColonyStrengthClassifier(BaseEstimator, ClassifierMixin):
     def _create_model(self) -> BaseEstimator:
         """Dynamically imports and instantiates the model from its full class path."""
         try:
-            module_path, class_name = self.config.model_class_path.rsplit('.', 1)
-            module = importlib.import_module(module_path)
-            model_class = getattr(module, class_name)
-            return model_class(**self.config.hyperparameters)
-        except (ImportError, AttributeError, ValueError) as e:
+            model_class = import_class(self.config.model_class_path)
+        except ImportError as e:
             raise ImportError(
                 f"Could not import model from path '{self.config.model_class_path}'. "
                 f"Please check the path and ensure the library is installed."
             ) from e
+        hyperparameters = dict(self.config.hyperparameters)
+        if 'n_jobs' not in hyperparameters and 'n_jobs' in inspect.signature(model_class).parameters:
+            hyperparameters['n_jobs'] = DEFAULT_N_JOBS
+        return model_class(**hyperparameters)
 
     def fit(self, X: pd.DataFrame, y: pd.Series):
         """
@@ -67,7 +72,16 @@ class ColonyStrengthClassifier(BaseEstimator, ClassifierMixin):
 
     @property
     def feature_importances_(self):
-        """Exposes the feature importances of the underlying model."""
+        """
+        Exposes the feature importances of the underlying model.
+
+        Not every estimator has them: the default HistGradientBoostingClassifier
+        does not (use sklearn.inspection.permutation_importance instead), while
+        e.g. RandomForestClassifier does.
+
+        Raises:
+            AttributeError: If the underlying model has no feature_importances_.
+        """
         check_is_fitted(self, '_model')
         if hasattr(self._model, 'feature_importances_'):
             return self._model.feature_importances_
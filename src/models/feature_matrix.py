@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+# Tree ensembles in scikit-learn work on float32 internally, so producing
+# that dtype up front avoids a second conversion inside the estimator.
+FEATURE_MATRIX_DTYPE = np.float32
+
+
+def select_feature_matrix(X: pd.DataFrame, columns: list[str]) -> np.ndarray:
+    """
+    Selects the model's feature columns and returns them as the feature matrix.
+
+    A plain column subset does not need ColumnTransformer's machinery
+    (per-transformer fitting, type inspection, sparse handling, output
+    reassembly), so this is used directly as a FunctionTransformer.
+
+    The matrix is preallocated and every column is cast straight into its
+    slot, instead of first gathering the subset into a new DataFrame and
+    converting that, so the feature data is copied once.
+
+    Args:
+        X (pd.DataFrame): The preprocessed data.
+        columns (list[str]): The feature columns, in model order.
+
+    Returns:
+        np.ndarray: A C-contiguous float32 array of shape (n_samples, len(columns)).
+    """
+    missing = [col for col in columns if col not in X.columns]
+    if missing:
+        raise KeyError(f"{missing} not in index")
+
+    matrix = np.empty((len(X), len(columns)), dtype=FEATURE_MATRIX_DTYPE)
+    for j, col in enumerate(columns):
+        values = X[col]
+        if isinstance(values.dtype, np.dtype):
+            matrix[:, j] = values.to_numpy()
+        else:
+            # Extension dtypes (nullable, Arrow-backed) need their missing values mapped to NaN
+            matrix[:, j] = values.to_numpy(dtype=FEATURE_MATRIX_DTYPE, na_value=np.nan)
+    return matrix
@@ -30,12 +30,18 @@ class FullPipelinePyFunc(mlflow.pyfunc.PythonModel):
 
         Args:
             context: MLflow context (unused here).
-            model_input (pd.DataFrame): Raw input data with an index.
+            model_input (pd.DataFrame): Raw input data with an index. A PyArrow
+                Table or RecordBatch is also accepted and converted once here.
 
         Returns:
             pd.Series: A Series containing the predictions, indexed by the
                        original index of the input rows that were scored.
         """
+        # Arrow input is materialized once, with one block per column so the
+        # conversion does not consolidate (and copy) same-typed columns.
+        if not isinstance(model_input, pd.DataFrame) and hasattr(model_input, "to_pandas"):
+            model_input = model_input.to_pandas(split_blocks=True)
+
         # Step 1: Apply the outlier remover.
         cleaned_x, _ = self._outlier_remover.transform(model_input)
 
@@ -1,16 +1,26 @@
 import pandas as pd
+from sklearn import config_context
 from sklearn.pipeline import Pipeline
-from sklearn.compose import ColumnTransformer
+from sklearn.preprocessing import FunctionTransformer
+from sklearn.utils import get_tags
 
 from src.config.schema import PipelineConfig
-from src.data.preprocessor.component import FeaturesPreprocessor
+from src.data.preprocessor.component import CachedPreprocessor
 from src.data.outlier_remover import OutlierRemover
 from src.models.colony_classifier import ColonyStrengthClassifier
+from src.models.feature_matrix import select_feature_matrix
 from src.models.pyfunc_wrapper import FullPipelinePyFunc
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+def _estimator_allows_nan(model_config) -> bool:
+    """Whether the configured estimator accepts NaN in its input, according to its sklearn tags."""
+    try:
+        return get_tags(ColonyStrengthClassifier(model_config)._create_model()).input_tags.allow_nan
+    except Exception:
+        return False
+
 def train_model(
     X_train: pd.DataFrame,
     y_train: pd.Series,
@@ -40,15 +50,25 @@ def train_model(
     # Step 2: Define and train the core scikit-learn pipeline
     logger.info("--- Assembling and Training the core scikit-learn pipeline ---")
     sklearn_pipeline = Pipeline(steps=[
-        ('preprocessor', FeaturesPreprocessor(steps=config.data_preprocessor)),
-        ('feature_selector', ColumnTransformer(
-            transformers=[('selector', 'passthrough', config.training.feature_columns)],
-            remainder='drop',
-            verbose_feature_names_out=False
+        ('preprocessor', CachedPreprocessor(
+            steps=config.data_preprocessor,
+            n_jobs=config.training.preprocessor_n_jobs
+        )),
+        ('feature_selector', FunctionTransformer(
+            select_feature_matrix,
+            kw_args={'columns': list(config.training.feature_columns)}
         )),
         ('classifier', ColonyStrengthClassifier(config.model))
     ])
-    sklearn_pipeline.fit(X_train_clean, y_train_clean)
+    # The feature matrix can contain NaN (e.g. the std of a single-row group).
+    # Estimators that handle NaN themselves (HistGradientBoosting, random
+    # forests) skip sklearn's full-matrix finiteness scan; the features are
+    # differences and aggregates of finite readings, so no infinities occur.
+    # Any other estimator keeps the validation and its clear error message.
+    # The context is local to this fit, not a global sklearn setting.
+    assume_finite = _estimator_allows_nan(config.model)
+    with config_context(assume_finite=assume_finite, transform_output="default"):
+        sklearn_pipeline.fit(X_train_clean, y_train_clean)
 
     # Step 3: Assemble the final PyFunc model with the fitted components
     logger.info("--- Assembling the final FullPipelinePyFunc model ---")
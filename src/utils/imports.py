@@ -0,0 +1,20 @@
+import functools
+import importlib
+
+
+@functools.lru_cache(maxsize=None)
+def import_class(class_path: str) -> type:
+    """
+    Imports a class from its fully qualified path, e.g.
+    'sklearn.ensemble.RandomForestClassifier'. Cached, so repeated fits do not
+    repeat the import machinery.
+
+    Raises:
+        ImportError: If the module or the class cannot be found.
+    """
+    try:
+        module_path, class_name = class_path.rsplit('.', 1)
+        module = importlib.import_module(module_path)
+        return getattr(module, class_name)
+    except (ImportError, AttributeError, ValueError) as e:
+        raise ImportError(f"Could not import class '{class_path}'.") from e
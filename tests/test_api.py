@@ -1,13 +1,16 @@
 # tests/test_api.py
 
 import json
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 import pandas as pd
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
+from prometheus_client import REGISTRY
 
 from src.api.main import app
 from src.api.schema import PredictionRequest
+from src.api.service import ModelService
 
 
 @pytest.fixture
@@ -17,6 +20,14 @@ def client():
         yield client
 
 
+@pytest.fixture
+def mock_model_service(client):
+    """Replace the model service loaded at startup with a mock."""
+    service = MagicMock()
+    client.app.state.model_service = service
+    return service
+
+
 def test_health_endpoint(client):
     """Test the health check endpoint."""
     response = client.get("/health")
@@ -24,6 +35,11 @@ def test_health_endpoint(client):
     assert response.json() == {"status": "healthy"}
 
 
+def test_model_service_loaded_at_startup(client):
+    """Test that the model service is created by the lifespan handler."""
+    assert isinstance(client.app.state.model_service, ModelService)
+
+
 def test_root_endpoint(client):
     """Test the root endpoint."""
     response = client.get("/")
@@ -32,7 +48,6 @@ def test_root_endpoint(client):
     assert "endpoints" in response.json()
 
 
-@patch("src.api.main.model_service")
 def test_predict_endpoint_success(mock_model_service, client):
     """Test the prediction endpoint with a successful prediction."""
     # Mock the model service to return predictions
@@ -78,7 +93,6 @@ def test_predict_endpoint_success(mock_model_service, client):
     assert len(args[0]) == 2  # 2 rows in the DataFrame
 
 
-@patch("src.api.main.model_service")
 def test_predict_endpoint_model_error(mock_model_service, client):
     """Test the prediction endpoint when the model fails."""
     # Mock the model service to raise an exception
@@ -103,3 +117,87 @@ def test_predict_endpoint_model_error(mock_model_service, client):
     # Check the response (should be a 500 Internal Server Error)
     assert response.status_code == 500
     assert "Prediction failed" in response.json()["detail"]
+
+
+def test_predict_endpoint_invalid_body(mock_model_service, client):
+    """Test that malformed request bodies are rejected before reaching the model."""
+    response = client.post("/predict", json={"instances": "not-a-list"})
+    assert response.status_code == 422
+    response = client.post("/predict", content=b"{not json", headers={"Content-Type": "application/json"})
+    assert response.status_code == 422
+    mock_model_service.predict.assert_not_called()
+
+
+def test_predict_request_from_json():
+    """Test decoding a raw request body."""
+    request = PredictionRequest.from_json(b'{"instances": [{"temperature": 24.5}]}')
+    assert request.instances == [{"temperature": 24.5}]
+
+
+def test_predict_endpoint_documents_request_body(client):
+    """Test that the manually decoded body is still described in the OpenAPI schema."""
+    schema = client.get("/openapi.json").json()
+    request_body = schema["paths"]["/predict"]["post"]["requestBody"]
+    assert "instances" in request_body["content"]["application/json"]["schema"]["properties"]
+
+
+def test_to_dataframe_matches_pandas_constructor():
+    """Test that the request conversion matches pd.DataFrame on typical payloads."""
+    payloads = [
+        [{"a": 1, "b": 2.5, "c": "x"}, {"a": 2, "b": None, "c": "y"}],
+        [{"a": 1}, {"a": 2, "b": 3.5}],  # ragged records
+        [{"a": 1}, {"a": "x"}],  # mixed types in a column
+    ]
+    for instances in payloads:
+        result = PredictionRequest(instances=instances).to_dataframe()
+        pd.testing.assert_frame_equal(result, pd.DataFrame(instances), check_dtype=False)
+
+
+def test_predict_endpoint_preserves_record_ids(mock_model_service, client):
+    """Test that record ids are serialized from the prediction index."""
+    mock_model_service.predict.return_value = pd.Series(["L", "S"], index=[3, 7])
+
+    response = client.post("/predict", json={"instances": [{"temperature": 24.5}, {"temperature": 20.1}]})
+
+    assert response.status_code == 200
+    assert response.json() == {"predictions": ["L", "S"], "record_ids": [3, 7]}
+
+
+def test_records_to_frame_uses_signature_types():
+    """Test that request frames are built from the model signature's columns."""
+    service = ModelService()
+    service.input_columns = [("sensor_id", np.dtype("int64")), ("temperature", np.dtype("float64"))]
+    records = [
+        {"temperature": 24, "sensor_id": 1, "extra": "ignored"},
+        {"temperature": 25.5, "sensor_id": 2, "extra": "ignored"},
+    ]
+
+    df = service.records_to_frame(records)
+
+    assert df.columns.tolist() == ["sensor_id", "temperature"]
+    assert df.dtypes.tolist() == [np.dtype("int64"), np.dtype("float64")]
+    assert df["temperature"].tolist() == [24.0, 25.5]
+
+
+def test_records_to_frame_falls_back_when_records_do_not_fit():
+    """Test that records not matching the signature use the generic path."""
+    service = ModelService()
+    service.input_columns = [("sensor_id", np.dtype("int64"))]
+
+    assert service.records_to_frame([{"temperature": 24.5}]) is None
+    assert service.records_to_frame([{"sensor_id": 1.5}]) is None
+    assert service.records_to_frame([{"sensor_id": None}]) is None
+
+
+def test_metrics_endpoint_reports_predictions(mock_model_service, client):
+    """Test that /predict latency and batching are exposed on /metrics."""
+    mock_model_service.predict.return_value = pd.Series(["Strong"], index=[0])
+    before = REGISTRY.get_sample_value("predict_latency_seconds_count") or 0
+
+    assert client.post("/predict", json={"instances": [{"temperature": 24.5}]}).status_code == 200
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert "predict_batch_size_bucket" in response.text
+    assert "predict_queue_wait_seconds_bucket" in response.text
+    assert REGISTRY.get_sample_value("predict_latency_seconds_count") == before + 1
@@ -0,0 +1,98 @@
+import asyncio
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+from prometheus_client import REGISTRY
+
+from src.api.batching import MicroBatcher
+
+
+def _run_concurrently(batcher, frames):
+    """Start the batcher, submit all frames at once and collect the results."""
+    async def scenario():
+        await batcher.start()
+        try:
+            return await asyncio.gather(
+                *(batcher.predict(frame) for frame in frames),
+                return_exceptions=True
+            )
+        finally:
+            await batcher.stop()
+    return asyncio.run(scenario())
+
+
+def _echo_predict(data):
+    """Predicts the 'value' column as a string, preserving the index."""
+    return data["value"].astype(str).rename("prediction")
+
+
+def test_concurrent_requests_are_coalesced():
+    predict_fn = MagicMock(side_effect=_echo_predict)
+    batcher = MicroBatcher(predict_fn, max_batch_size=8, max_wait_ms=50)
+    frames = [
+        pd.DataFrame({"value": [1, 2]}),
+        pd.DataFrame({"value": [3]}),
+        pd.DataFrame({"value": [4, 5, 6]}),
+    ]
+
+    results = _run_concurrently(batcher, frames)
+
+    predict_fn.assert_called_once()
+    assert [r.tolist() for r in results] == [["1", "2"], ["3"], ["4", "5", "6"]]
+    # Each caller gets back its own record ids
+    assert [r.index.tolist() for r in results] == [[0, 1], [0], [0, 1, 2]]
+
+
+def test_filtered_rows_are_scattered_to_the_right_request():
+    def drop_even(data):
+        return _echo_predict(data[data["value"] % 2 == 1])
+
+    batcher = MicroBatcher(drop_even, max_batch_size=8, max_wait_ms=50)
+    frames = [pd.DataFrame({"value": [1, 2]}), pd.DataFrame({"value": [4]})]
+
+    results = _run_concurrently(batcher, frames)
+
+    assert results[0].tolist() == ["1"]
+    assert results[1].empty
+
+
+def test_batch_size_limit_is_respected():
+    predict_fn = MagicMock(side_effect=_echo_predict)
+    batcher = MicroBatcher(predict_fn, max_batch_size=2, max_wait_ms=50)
+    frames = [pd.DataFrame({"value": [i]}) for i in range(5)]
+
+    results = _run_concurrently(batcher, frames)
+
+    assert predict_fn.call_count == 3
+    assert [r.tolist() for r in results] == [[str(i)] for i in range(5)]
+
+
+def test_failing_request_does_not_fail_the_batch():
+    def predict_fn(data):
+        if (data["value"] < 0).any():
+            raise ValueError("negative value")
+        return _echo_predict(data)
+
+    batcher = MicroBatcher(predict_fn, max_batch_size=8, max_wait_ms=50)
+    frames = [pd.DataFrame({"value": [1]}), pd.DataFrame({"value": [-1]})]
+
+    results = _run_concurrently(batcher, frames)
+
+    assert results[0].tolist() == ["1"]
+    assert isinstance(results[1], ValueError)
+
+
+def test_predict_before_start_raises():
+    batcher = MicroBatcher(_echo_predict)
+    with pytest.raises(RuntimeError):
+        asyncio.run(batcher.predict(pd.DataFrame({"value": [1]})))
+
+
+def test_batch_size_is_recorded():
+    before = REGISTRY.get_sample_value("predict_batch_size_sum") or 0
+    batcher = MicroBatcher(_echo_predict, max_batch_size=8, max_wait_ms=50)
+    frames = [pd.DataFrame({"value": [i]}) for i in range(3)]
+
+    _run_concurrently(batcher, frames)
+
+    assert REGISTRY.get_sample_value("predict_batch_size_sum") == before + 3
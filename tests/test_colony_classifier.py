@@ -72,3 +72,29 @@ def test_feature_importances_raises_for_model_without_importances(default_config
     clf.fit(X, y)
     with pytest.raises(AttributeError):
         _ = clf.feature_importances_
+
+def test_fit_raises_for_unknown_model_class(sample_data):
+    config = ColonyStrengthClassifierConfig(model_class_path="sklearn.ensemble.DoesNotExist")
+    X, y = sample_data
+    with pytest.raises(ImportError):
+        ColonyStrengthClassifier(config).fit(X, y)
+
+def test_n_jobs_defaults_to_all_cores_when_supported(sample_data, default_config):
+    X, y = sample_data
+    clf = ColonyStrengthClassifier(default_config).fit(X, y)
+    assert clf._model.n_jobs == -1
+
+def test_configured_n_jobs_is_kept(sample_data):
+    config = ColonyStrengthClassifierConfig(
+        model_class_path="sklearn.ensemble.RandomForestClassifier",
+        hyperparameters={"n_estimators": 5, "n_jobs": 1}
+    )
+    X, y = sample_data
+    assert ColonyStrengthClassifier(config).fit(X, y)._model.n_jobs == 1
+
+def test_n_jobs_is_not_passed_to_models_without_it(sample_data):
+    config = ColonyStrengthClassifierConfig(model_class_path="sklearn.tree.DecisionTreeClassifier")
+    X, y = sample_data
+    clf = ColonyStrengthClassifier(config).fit(X, y)
+    assert 'n_jobs' not in clf._model.get_params()
+    assert len(clf.predict(X)) == len(X)
@@ -0,0 +1,36 @@
+import os
+import shutil
+from src.config.schema import PipelineConfig
+
+CONFIG_PATH = os.path.join("src", "config", "config.yaml")
+
+
+def test_from_yaml_loads_pipeline_config():
+    config = PipelineConfig.from_yaml(CONFIG_PATH)
+    assert config.outlier_remover.group_by_column == "sensor_id"
+    assert len(config.data_preprocessor) > 0
+
+
+def test_from_yaml_resolves_env_vars_on_every_load(monkeypatch):
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", "http://first:5000")
+    first = PipelineConfig.from_yaml(CONFIG_PATH)
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", "http://second:5000")
+    second = PipelineConfig.from_yaml(CONFIG_PATH)
+    assert first.mlflow.tracking_uri == "http://first:5000"
+    assert second.mlflow.tracking_uri == "http://second:5000"
+    # Each load returns an independent object
+    assert first is not second
+
+
+def test_from_yaml_picks_up_file_changes(tmp_path):
+    path = tmp_path / "config.yaml"
+    shutil.copy(CONFIG_PATH, path)
+    before = PipelineConfig.from_yaml(str(path))
+
+    content = path.read_text().replace('group_by_column: "sensor_id"', 'group_by_column: "hive_id"')
+    path.write_text(content)
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+    after = PipelineConfig.from_yaml(str(path))
+
+    assert before.outlier_remover.group_by_column == "sensor_id"
+    assert after.outlier_remover.group_by_column == "hive_id"
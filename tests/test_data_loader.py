@@ -34,3 +34,98 @@ def test_unsupported_data_source_type():
     with pytest.raises(ValueError) as excinfo:
         loader.load_data()
     assert "Unsupported data source type" in str(excinfo.value)
+
+@pytest.mark.parametrize("engine", ["pyarrow", "pandas"])
+def test_csv_engines_return_identical_frames(engine):
+    df = pd.DataFrame({
+        "id": [1, 2, 3],
+        "value": [0.5, None, 1.5],
+        "timestamp": ["2019-09-12 09:07:55", "2019-09-12 09:19:38", "2019-09-12 09:20:05"],
+        "label": ["S", "M", "L"],
+        "note": ["x", "", "NA"],
+    })
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as tmp:
+        df.to_csv(tmp.name, index=False)
+        tmp_path = tmp.name
+    try:
+        config = DataLoaderConfig(type="csv", path=tmp_path, engine=engine)
+        loaded_df = DataLoader(config).load_data()
+        # Empty and 'NA' cells are missing values, as in pd.read_csv; Arrow
+        # returns missing strings as None and pandas as NaN.
+        assert loaded_df["note"].isna().tolist() == [False, True, True]
+        pd.testing.assert_frame_equal(loaded_df.drop(columns="note"), df.drop(columns="note"))
+    finally:
+        os.remove(tmp_path)
+
+@pytest.mark.parametrize("source_type, writer", [
+    ("parquet", lambda df, path: df.to_parquet(path, index=False)),
+    ("feather", lambda df, path: df.to_feather(path)),
+])
+def test_load_from_columnar_formats(source_type, writer):
+    df = pd.DataFrame({"a": [1, 2], "b": [3.0, None], "c": ["x", "y"]})
+    with tempfile.NamedTemporaryFile(suffix=f".{source_type}", delete=False) as tmp:
+        tmp_path = tmp.name
+    try:
+        writer(df, tmp_path)
+        config = DataLoaderConfig(type=source_type, path=tmp_path)
+        loaded_df = DataLoader(config).load_data()
+        pd.testing.assert_frame_equal(loaded_df, df)
+    finally:
+        os.remove(tmp_path)
+
+@pytest.mark.parametrize("stratify", [True, False])
+def test_load_split_matches_train_test_split(stratify):
+    from sklearn.model_selection import train_test_split
+    df = pd.DataFrame({"a": range(20), "b": [i * 0.5 for i in range(20)], "label": ["S", "M", "L", "M"] * 5})
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as tmp:
+        df.to_csv(tmp.name, index=False)
+        tmp_path = tmp.name
+    try:
+        config = DataLoaderConfig(type="csv", path=tmp_path)
+        X_train, X_test, y_train, y_test = DataLoader(config).load_split(
+            "label", test_size=0.25, random_state=0, stratify=stratify
+        )
+        expected = train_test_split(
+            df.drop(columns=["label"]), df["label"],
+            test_size=0.25, random_state=0, stratify=df["label"] if stratify else None
+        )
+        pd.testing.assert_frame_equal(X_train, expected[0])
+        pd.testing.assert_frame_equal(X_test, expected[1])
+        pd.testing.assert_series_equal(y_train, expected[2])
+        pd.testing.assert_series_equal(y_test, expected[3])
+    finally:
+        os.remove(tmp_path)
+
+@pytest.mark.parametrize("source_type, engine, writer", [
+    ("csv", "pyarrow", lambda df, path: df.to_csv(path, index=False)),
+    ("csv", "pandas", lambda df, path: df.to_csv(path, index=False)),
+    ("parquet", "pyarrow", lambda df, path: df.to_parquet(path, index=False)),
+    ("feather", "pyarrow", lambda df, path: df.to_feather(path)),
+])
+def test_pyarrow_dtype_backend(source_type, engine, writer):
+    df = pd.DataFrame({"id": [1, 2, 3], "value": [0.5, None, 1.5]})
+    with tempfile.NamedTemporaryFile(suffix=f".{source_type}", delete=False) as tmp:
+        tmp_path = tmp.name
+    try:
+        writer(df, tmp_path)
+        config = DataLoaderConfig(type=source_type, path=tmp_path, engine=engine, dtype_backend="pyarrow")
+        loaded_df = DataLoader(config).load_data()
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in loaded_df.dtypes)
+        pd.testing.assert_frame_equal(loaded_df.astype({"id": "int64", "value": "float64"}), df)
+    finally:
+        os.remove(tmp_path)
+
+def test_load_split_skips_stratification_for_balanced_classes():
+    from sklearn.model_selection import train_test_split
+    df = pd.DataFrame({"a": range(20), "label": ["S", "L"] * 10})
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as tmp:
+        df.to_csv(tmp.name, index=False)
+        tmp_path = tmp.name
+    try:
+        config = DataLoaderConfig(type="csv", path=tmp_path)
+        X_train, X_test, _, _ = DataLoader(config).load_split("label", test_size=0.25, random_state=0, stratify=True)
+        expected_train, expected_test = train_test_split(df.drop(columns=["label"]), test_size=0.25, random_state=0)
+        pd.testing.assert_frame_equal(X_train, expected_train)
+        pd.testing.assert_frame_equal(X_test, expected_test)
+    finally:
+        os.remove(tmp_path)
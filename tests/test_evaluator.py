@@ -19,3 +19,20 @@ def test_evaluate_model_accuracy():
     assert "f1_macro" in metrics["metrics"]
     # For this dummy, accuracy should be 2/3
     assert np.isclose(metrics["metrics"]["accuracy"], 2/3)
+
+class FilteringModel(FullPipelinePyFunc):
+    def predict(self, context, model_input):
+        # Drops the first row, as the outlier remover would
+        return pd.Series([1] * (len(model_input) - 1), index=model_input.index[1:])
+
+def test_evaluate_model_aligns_filtered_predictions():
+    X_test = pd.DataFrame({'f1': [1, 2, 3]}, index=[10, 11, 12])
+    y_test = pd.Series([0, 1, 1], index=X_test.index)
+    metrics = evaluate_model(FilteringModel(None, None), X_test, y_test, metrics_to_compute=["accuracy"])
+    assert metrics["metrics"]["accuracy"] == 1.0
+
+def test_evaluate_model_returns_head_predictions():
+    X_test = pd.DataFrame({'f1': range(10)})
+    y_test = pd.Series([1] * 10, index=X_test.index)
+    results = evaluate_model(DummyModel(None, None), X_test, y_test, metrics_to_compute=["accuracy"])
+    pd.testing.assert_series_equal(results["head_predictions"], pd.Series([1] * 5))
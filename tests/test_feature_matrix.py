@@ -0,0 +1,24 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.models.feature_matrix import select_feature_matrix
+
+
+def test_select_feature_matrix_keeps_column_order():
+    X = pd.DataFrame({'a': [1.0, 2.0], 'b': [3, 4], 'c': ['x', 'y']})
+    matrix = select_feature_matrix(X, ['b', 'a'])
+    np.testing.assert_array_equal(matrix, [[3, 1], [4, 2]])
+    assert matrix.dtype == np.float32
+    assert matrix.flags.c_contiguous
+
+
+def test_select_feature_matrix_maps_missing_values_to_nan():
+    X = pd.DataFrame({'a': pd.array([1, None], dtype='Int64'), 'b': [0.5, np.nan]})
+    matrix = select_feature_matrix(X, ['a', 'b'])
+    np.testing.assert_array_equal(matrix, [[1.0, 0.5], [np.nan, np.nan]])
+
+
+def test_select_feature_matrix_rejects_missing_columns():
+    X = pd.DataFrame({'a': [1.0]})
+    with pytest.raises(KeyError):
+        select_feature_matrix(X, ['a', 'z'])
@@ -67,3 +67,63 @@ def test_missing_columns_raises(sample_data, config):
     bad_data = sample_data.drop(columns=['temperature_sensor'])
     with pytest.raises(ValueError):
         remover.fit(bad_data)
+
+def test_transform_drops_unseen_groups_and_keeps_order(sample_data, config):
+    remover = OutlierRemover(config)
+    remover.fit(sample_data)
+    new_data = pd.DataFrame({
+        'sensor_id': ['C', 'D', 'A', 'B'],
+        'temperature_sensor': [12, 30, 21, 55],
+    }, index=[10, 11, 12, 13])
+    X_filtered, _ = remover.transform(new_data)
+    # Unseen group D and outlier group B are removed; row order is preserved
+    assert X_filtered.index.tolist() == [10, 12]
+
+def test_fit_stores_allowed_groups(sample_data, config):
+    remover = OutlierRemover(config)
+    remover.fit(sample_data)
+    assert set(remover._allowed_groups) == {'A', 'C'}
+
+def test_integer_group_ids_use_lookup_table(config):
+    train = pd.DataFrame({
+        'sensor_id': [1, 1, 3, 3, 7],
+        'temperature_sensor': [20, 22, 55, 54, 12],
+    })
+    remover = OutlierRemover(config)
+    remover.fit(train)
+    assert remover._allowed_lookup is not None
+
+    new_data = pd.DataFrame({
+        'sensor_id': [7, 3, -1, 1, 2, 1000],
+        'temperature_sensor': [12, 55, 20, 21, 30, 20],
+    })
+    X_filtered, _ = remover.transform(new_data)
+    # Outlier group 3 and unseen/out-of-range ids are removed
+    assert X_filtered['sensor_id'].tolist() == [7, 1]
+    # Same result as the membership test on non-integer input
+    expected = new_data[new_data['sensor_id'].isin(remover._allowed_groups)]
+    pd.testing.assert_frame_equal(X_filtered, expected)
+
+def test_string_group_ids_have_no_lookup_table(sample_data, config):
+    remover = OutlierRemover(config)
+    remover.fit(sample_data)
+    assert remover._allowed_lookup is None
+
+def test_group_means_match_pandas_groupby(config):
+    data = pd.DataFrame({
+        'sensor_id': [3, 1, 3, None, 1, 2],
+        'temperature_sensor': [20.0, 30.0, None, 40.0, 10.0, None],
+    })
+    remover = OutlierRemover(config)
+    remover.fit(data)
+    expected = data.groupby('sensor_id')['temperature_sensor'].mean()
+    pd.testing.assert_series_equal(remover._group_means, expected)
+
+def test_transform_returns_input_when_nothing_is_removed(sample_data, config):
+    remover = OutlierRemover(config)
+    remover.fit(sample_data)
+    clean = sample_data[sample_data['sensor_id'] != 'B']
+    y = clean['size']
+    X_filtered, y_filtered = remover.transform(clean, y)
+    assert X_filtered is clean
+    assert y_filtered is y
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 import pandas as pd
 from src.data.preprocessor.component import FeaturesPreprocessor
 from src.data.preprocessor.schema import PreprocessorStepConfig
@@ -43,12 +44,13 @@ def get_df():
         "float_col": [1.0, 2.0, None, 4.0],
     })
 
-def test_fit_transform_pipeline():
-    steps = get_steps()
-    df = get_df()
-    preprocessor = FeaturesPreprocessor(steps)
-    preprocessor.fit(df)
-    result = preprocessor.transform(df)
+@pytest.fixture(scope="module")
+def fitted_preprocessor():
+    """A preprocessor fitted on get_df(), shared by the tests that only read from it."""
+    return FeaturesPreprocessor(get_steps()).fit(get_df())
+
+def test_fit_transform_pipeline(fitted_preprocessor):
+    result = fitted_preprocessor.transform(get_df())
     # Check columns
     assert "diff_col" in result.columns
     assert "bin_col" in result.columns
@@ -59,12 +61,8 @@ def test_fit_transform_pipeline():
     # Check binarizer
     assert set(result["bin_col"].unique()).issubset({0, 1})
 
-def test_metadata():
-    steps = get_steps()
-    df = get_df()
-    preprocessor = FeaturesPreprocessor(steps)
-    preprocessor.fit(df)
-    metadata = preprocessor.get_metadata()
+def test_metadata(fitted_preprocessor):
+    metadata = fitted_preprocessor.get_metadata()
     assert isinstance(metadata, list)
     assert all("name" in m.model_dump() for m in metadata)
     assert all("class_path" in m.model_dump() for m in metadata)
@@ -82,3 +80,223 @@ def test_error_on_transform_before_fit():
     preprocessor = FeaturesPreprocessor(steps)
     with pytest.raises(RuntimeError):
         preprocessor.transform(df)
+
+def test_input_is_not_modified():
+    steps = get_steps()
+    df = get_df()
+    original = df.copy()
+    preprocessor = FeaturesPreprocessor(steps)
+    preprocessor.fit(df)
+    preprocessor.transform(df)
+    pd.testing.assert_frame_equal(df, original)
+
+def test_new_column_steps_do_not_copy_untouched_columns():
+    from src.data.preprocessor.feature_store import ColumnSubtractor, MeanImputer
+    df = get_df()
+    imputer = MeanImputer(input_cols=["float_col"]).fit(df)
+    imputed = imputer.transform(df)
+    assert imputed["float_col"].isna().sum() == 0
+    assert np.shares_memory(imputed["int_col"].to_numpy(), df["int_col"].to_numpy())
+
+    subtractor = ColumnSubtractor(
+        input_cols=["float_col", "int_col"], output_col="diff_col", col_a="float_col", col_b="int_col"
+    ).fit(imputed)
+    result = subtractor.transform(imputed)
+    assert "diff_col" not in imputed.columns
+    assert np.shares_memory(result["float_col"].to_numpy(), imputed["float_col"].to_numpy())
+
+def test_grouped_aggregator_matches_left_merge():
+    from src.data.preprocessor.feature_store import GroupedAggregator
+    train = pd.DataFrame({"group": ["a", "a", "b"], "value": [1.0, 3.0, 5.0]})
+    aggregator = GroupedAggregator(
+        input_cols=["value"], groupby_col="group",
+        aggregations={"value": ["mean", "max"]}, output_cols=["value_mean", "value_max"]
+    ).fit(train)
+
+    new = pd.DataFrame({"group": ["b", "c", "a", "b"], "value": [0.0, 1.0, 2.0, 3.0]}, index=[7, 5, 3, 1])
+    result = aggregator.transform(new)
+
+    expected = new.merge(aggregator.agg_df_, left_on="group", right_index=True, how="left")
+    pd.testing.assert_frame_equal(result, expected)
+
+def test_arithmetic_features_match_single_steps():
+    from src.data.preprocessor.feature_store import (
+        AbsoluteDifference, ArithmeticFeaturesTransformer, ColumnSubtractor, ThresholdBinarizer
+    )
+    df = pd.DataFrame({"a": [3.0, 1.0, None, 8.0], "b": [1.0, 4.0, 2.0, 8.0]})
+    fused = ArithmeticFeaturesTransformer(features=[
+        {"op": "subtract", "col_a": "a", "col_b": "b", "output_col": "diff"},
+        {"op": "abs_diff", "col_a": "a", "col_b": "b", "output_col": "abs_diff"},
+        {"op": "greater", "col_a": "a", "threshold": 2, "output_col": "flag"},
+    ]).fit(df)
+
+    expected = df
+    for step in [
+        ColumnSubtractor(input_cols=["a", "b"], output_col="diff", col_a="a", col_b="b"),
+        AbsoluteDifference(input_cols=["a", "b"], output_col="abs_diff", col_a="a", col_b="b"),
+        ThresholdBinarizer(input_col="a", output_col="flag", threshold=2),
+    ]:
+        expected = step.fit(expected).transform(expected)
+
+    pd.testing.assert_frame_equal(fused.transform(df), expected)
+
+def test_arithmetic_features_reject_unknown_op():
+    from src.data.preprocessor.feature_store import ArithmeticFeaturesTransformer
+    transformer = ArithmeticFeaturesTransformer(features=[{"op": "divide", "col_a": "a", "output_col": "x"}])
+    with pytest.raises(ValueError):
+        transformer.fit(get_df())
+
+def test_fill_nan_columns_fills_per_column():
+    from src.data.preprocessor._kernels import fill_nan_columns
+    values = np.array([[1.0, np.nan], [np.nan, 2.0], [3.0, np.nan]])
+    filled = fill_nan_columns(values, np.array([10.0, 20.0]))
+    np.testing.assert_array_equal(filled, [[1.0, 20.0], [10.0, 2.0], [3.0, 20.0]])
+    assert filled.flags.f_contiguous
+
+def test_subtract_kernel_matches_numpy():
+    from src.data.preprocessor._kernels import subtract
+    a = np.array([1.0, np.nan, 5.0, -2.0])
+    b = np.array([3.0, 1.0, np.nan, -4.0])
+    np.testing.assert_array_equal(subtract(a, b), a - b)
+    np.testing.assert_array_equal(subtract(a, b, absolute=True), np.abs(a - b))
+
+def test_mean_imputer_array_path_matches_fillna(monkeypatch):
+    from src.data.preprocessor import feature_store
+    df = pd.DataFrame({
+        "a": [1.0, None, 3.0, None],
+        "b": [None, 2.0, 4.0, 6.0],
+        "c": [1, 2, 3, 4],
+    })
+    imputer = feature_store.MeanImputer(input_cols=["a", "b"]).fit(df)
+    expected = df.fillna(imputer.imputation_values_)
+
+    # Force the array path regardless of the input size; fill_nan_columns
+    # itself falls back to NumPy when Numba is not installed.
+    monkeypatch.setattr(feature_store, "NUMBA_AVAILABLE", True)
+    monkeypatch.setattr(feature_store.MeanImputer, "NUMBA_MIN_ROWS", 0)
+    pd.testing.assert_frame_equal(imputer.transform(df), expected)
+
+def test_metadata_dicts_are_built_once_per_fit():
+    df = get_df()
+    preprocessor = FeaturesPreprocessor(get_steps()).fit(df)
+    dicts = preprocessor.get_metadata_dicts()
+    assert dicts == [m.model_dump() for m in preprocessor.get_metadata()]
+    assert preprocessor.get_metadata_dicts() is dicts
+    preprocessor.fit(df)
+    assert preprocessor.get_metadata_dicts() is not dicts
+
+def test_fit_transform_matches_fit_then_transform(fitted_preprocessor):
+    df = get_df()
+    result = FeaturesPreprocessor(get_steps()).fit_transform(df)
+    expected = fitted_preprocessor.transform(df)
+    pd.testing.assert_frame_equal(result, expected)
+
+def test_cached_preprocessor_reuses_output_for_same_input():
+    import pickle
+    from src.data.preprocessor.component import CachedPreprocessor
+    df = get_df()
+    preprocessor = CachedPreprocessor(get_steps())
+    fitted = preprocessor.fit_transform(df)
+    # The same frame hits the cache, an equal but different frame does not
+    assert preprocessor.transform(df) is fitted
+    other = preprocessor.transform(df.copy())
+    assert other is not fitted
+    pd.testing.assert_frame_equal(other, fitted)
+
+    # Refitting invalidates the cache, and the cache is not pickled
+    preprocessor.fit(df)
+    assert preprocessor.transform(df) is not fitted
+    transformed = preprocessor.transform(df)
+    restored = pickle.loads(pickle.dumps(preprocessor))
+    assert not getattr(restored, "_cache", None)
+    # Pickling leaves the cache of the original object intact
+    assert preprocessor.transform(df) is transformed
+    pd.testing.assert_frame_equal(restored.transform(df), fitted)
+
+def test_threshold_binarizer_outputs_uint8_flags():
+    from src.data.preprocessor.feature_store import ThresholdBinarizer
+    df = get_df()
+    result = ThresholdBinarizer(input_col="float_col", output_col="flag", threshold=1.5).fit(df).transform(df)
+    assert result["flag"].dtype == np.uint8
+    assert result["flag"].tolist() == [0, 1, 0, 1]
+
+def test_int_to_float_converter_dtype():
+    from src.data.preprocessor.feature_store import IntToFloatConverter
+    df = get_df()
+    result = IntToFloatConverter(dtype="float32").fit(df).transform(df)
+    assert result["int_col"].dtype == np.float32
+    assert result["float_col"].dtype == np.float64
+    with pytest.raises(ValueError):
+        IntToFloatConverter(dtype="int32").fit(df)
+
+def test_difference_steps_keep_nullable_dtypes():
+    from src.data.preprocessor.feature_store import AbsoluteDifference, ColumnSubtractor
+    df = pd.DataFrame({"a": pd.array([1, None, 5], dtype="Int64"), "b": pd.array([3, 2, 1], dtype="Int64")})
+    diff = ColumnSubtractor(input_cols=["a", "b"], output_col="d", col_a="a", col_b="b").fit(df).transform(df)
+    absolute = AbsoluteDifference(input_cols=["a", "b"], output_col="d", col_a="a", col_b="b").fit(df).transform(df)
+    assert diff["d"].dtype == "Int64"
+    assert diff["d"].tolist() == [-2, pd.NA, 4]
+    assert absolute["d"].tolist() == [2, pd.NA, 4]
+
+def test_int_to_float_converter_returns_input_without_int_columns():
+    from src.data.preprocessor.feature_store import IntToFloatConverter
+    df = get_df()[["float_col"]]
+    assert IntToFloatConverter().fit(df).transform(df) is df
+
+def test_int_to_float_converter_skips_columns_already_converted():
+    from src.data.preprocessor.feature_store import IntToFloatConverter
+    df = pd.DataFrame({"int_col": [1, 2], "float_col": [0.5, 1.5]})
+    converter = IntToFloatConverter(columns=["int_col", "float_col"]).fit(df)
+    result = converter.transform(df)
+    assert result["int_col"].dtype == np.float64
+    assert converter.transform(result) is result
+
+def test_pipeline_accepts_arrow_backed_frames():
+    df = get_df()
+    arrow_df = df.astype({"int_col": "int64[pyarrow]", "float_col": "double[pyarrow]"})
+    result = FeaturesPreprocessor(get_steps()).fit_transform(arrow_df)
+    expected = FeaturesPreprocessor(get_steps()).fit_transform(df)
+    assert list(result.columns) == list(expected.columns)
+    np.testing.assert_allclose(
+        result.to_numpy(dtype=np.float64, na_value=np.nan), expected.to_numpy(dtype=np.float64)
+    )
+
+def test_parallel_transform_matches_sequential(monkeypatch):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "int_col": rng.integers(0, 10, 1000),
+        "float_col": np.where(rng.random(1000) < 0.1, np.nan, rng.normal(size=1000)),
+    })
+    sequential = FeaturesPreprocessor(get_steps()).fit(df)
+    parallel = FeaturesPreprocessor(get_steps(), n_jobs=4).fit(df)
+    monkeypatch.setattr(FeaturesPreprocessor, "PARALLEL_MIN_ROWS", 100)
+    pd.testing.assert_frame_equal(parallel.transform(df), sequential.transform(df))
+
+def test_parallel_transform_keeps_numba_kernels_off_worker_threads(monkeypatch):
+    import threading
+    from src.data.preprocessor import _kernels, feature_store
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "int_col": rng.integers(0, 10, 1000),
+        "float_col": np.where(rng.random(1000) < 0.1, np.nan, rng.normal(size=1000)),
+    })
+    expected = FeaturesPreprocessor(get_steps()).fit(df).transform(df)
+
+    # Every chunk is large enough for the Numba kernels; the parallel kernels
+    # are not thread-safe, so the worker threads must use the NumPy fallback.
+    monkeypatch.setattr(FeaturesPreprocessor, "PARALLEL_MIN_ROWS", 100)
+    monkeypatch.setattr(feature_store, "NUMBA_AVAILABLE", True)
+    monkeypatch.setattr(feature_store.MeanImputer, "NUMBA_MIN_ROWS", 0)
+    monkeypatch.setattr(feature_store, "DIFFERENCE_NUMBA_MIN_ROWS", 0)
+    worker_decisions = []
+    use_numba = _kernels._use_numba
+    def recording_use_numba():
+        decision = use_numba()
+        if threading.current_thread() is not threading.main_thread():
+            worker_decisions.append(decision)
+        return decision
+    monkeypatch.setattr(_kernels, "_use_numba", recording_use_numba)
+
+    result = FeaturesPreprocessor(get_steps(), n_jobs=4).fit(df).transform(df)
+    pd.testing.assert_frame_equal(result, expected)
+    assert worker_decisions and not any(worker_decisions)
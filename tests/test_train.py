@@ -20,7 +20,7 @@ class DummyOutlierRemoverConfig:
 
 class DummyModelConfig:
     model_class_path = "sklearn.ensemble.RandomForestClassifier"
-    hyperparameters = {'n_estimators': 1, 'max_depth': 2, 'random_state': 42}
+    hyperparameters = {'n_estimators': 1, 'max_depth': 2, 'random_state': 42, 'n_jobs': -1}
 
 class DummyConfig:
     # Minimal config for testing
@@ -29,15 +29,59 @@ class DummyConfig:
     model = DummyModelConfig()
     training = type('Training', (), {
         'feature_columns': ['f1', 'f2'],
+        'preprocessor_n_jobs': None,
     })()
 
-def test_train_model_returns_fullpipeline():
+@pytest.mark.parametrize("model_class_path, hyperparameters", [
+    ("sklearn.ensemble.RandomForestClassifier", DummyModelConfig.hyperparameters),
+    ("sklearn.ensemble.HistGradientBoostingClassifier", {'max_iter': 2, 'random_state': 42}),
+])
+def test_train_model_returns_fullpipeline(model_class_path, hyperparameters):
     # Create dummy data
     X = pd.DataFrame({'f1': [1, 2, 3, 4], 'f2': [0.1, 0.2, 0.3, 0.4], 'sensor_id': [1, 1, 2, 2], 'temperature_sensor': [20, 21, 22, 23]})
     y = pd.Series([0, 1, 0, 1])
     config = DummyConfig()
+    config.model = type('Model', (), {'model_class_path': model_class_path, 'hyperparameters': hyperparameters})()
     model = train_model(X, y, config)
     assert isinstance(model, FullPipelinePyFunc)
     # Use the public predict interface
     preds = model.predict(context=None, model_input=X)
     assert len(preds) == len(X)
+
+def test_fullpipeline_accepts_arrow_input():
+    pa = pytest.importorskip("pyarrow")
+    X = pd.DataFrame({'f1': [1, 2, 3, 4], 'f2': [0.1, 0.2, 0.3, 0.4], 'sensor_id': [1, 1, 2, 2], 'temperature_sensor': [20, 21, 22, 23]})
+    y = pd.Series([0, 1, 0, 1])
+    model = train_model(X, y, DummyConfig())
+    expected = model.predict(context=None, model_input=X)
+    preds = model.predict(context=None, model_input=pa.Table.from_pandas(X))
+    pd.testing.assert_series_equal(preds, expected)
+
+def test_float32_conversion_matches_float64_predictions():
+    from src.data.preprocessor import PreprocessorStepConfig
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame({
+        'f1': rng.integers(0, 100, 200),
+        'f2': rng.normal(size=200),
+        'sensor_id': rng.integers(0, 5, 200),
+        'temperature_sensor': rng.normal(20, 2, 200),
+    })
+    y = pd.Series((X['f1'] > 50).astype(int))
+
+    predictions = {}
+    for dtype in ("float64", "float32"):
+        config = DummyConfig()
+        config.data_preprocessor = [PreprocessorStepConfig(
+            name="to_float", class_path="feature_store.IntToFloatConverter", params={"dtype": dtype}
+        )]
+        model = train_model(X, y, config)
+        predictions[dtype] = model.predict(context=None, model_input=X)
+    pd.testing.assert_series_equal(predictions["float32"], predictions["float64"])
+
+def test_nan_intolerant_model_keeps_finiteness_validation():
+    X = pd.DataFrame({'f1': [1.0, np.nan, 3.0, 4.0], 'f2': [0.1, 0.2, 0.3, 0.4], 'sensor_id': [1, 1, 2, 2], 'temperature_sensor': [20, 21, 22, 23]})
+    y = pd.Series([0, 1, 0, 1])
+    config = DummyConfig()
+    config.model = type('Model', (), {'model_class_path': "sklearn.linear_model.LogisticRegression", 'hyperparameters': {}})()
+    with pytest.raises(ValueError, match="NaN"):
+        train_model(X, y, config)
@@ -1,17 +1,19 @@
 """
 Training pipeline entry point for the Colony Strength Classifier.
 This script orchestrates the entire training process from data loading to model evaluation.
+
+MLflow, scikit-learn and the pipeline modules are imported inside the
+functions that use them, so that '--help' and argument errors return
+without loading them.
 """
 import argparse
-import mlflow
+import json
+import os
+import tempfile
+import yaml
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from mlflow.models import infer_signature
-from sklearn.model_selection import train_test_split
 
-from src.config.schema import PipelineConfig
-from src.data.loader.component import DataLoader
-from src.train import train_model
-from src.evaluate import evaluate_model
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -33,9 +35,47 @@ def parse_args():
     return parser.parse_args()
 
 
+def log_dict_artifacts(artifacts: dict, artifact_path: str = None, run_id: str = None):
+    """
+    Logs several dictionaries as artifacts with a single upload.
+
+    Each entry is written to a temporary directory (as YAML if its name ends
+    in .yaml/.yml, JSON otherwise, like mlflow.log_dict) and the directory
+    is then logged at once instead of making one request per artifact.
+
+    Args:
+        artifacts: Mapping of artifact file name to its content.
+        artifact_path: Directory within the run's artifact URI to log to.
+        run_id: The run to log to. Defaults to the active run, which is only
+            visible from the thread that started it.
+    """
+    if not artifacts:
+        return
+    import mlflow
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, content in artifacts.items():
+            path = os.path.join(tmp_dir, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                if name.endswith((".yaml", ".yml")):
+                    yaml.safe_dump(content, f, default_flow_style=False)
+                else:
+                    json.dump(content, f, indent=2)
+        mlflow.log_artifacts(tmp_dir, artifact_path, run_id=run_id)
+
+
 def main():
     """Main entry point for the training pipeline."""
     args = parse_args()
+
+    import mlflow
+    from mlflow.models import infer_signature
+    from src.config.schema import PipelineConfig
+    from src.data.loader.component import DataLoader
+    from src.evaluate import evaluate_model
+    from src.train import train_model
+
     config = PipelineConfig.from_yaml(args.config)
     if args.tracking_uri:
         config.mlflow.tracking_uri = args.tracking_uri
@@ -46,21 +86,22 @@ def main():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     run_name = config.mlflow.run_name.replace("{timestamp}", timestamp)
 
-    with mlflow.start_run(run_name=run_name) as run:
-        logger.info(f"Started MLflow run: {run.info.run_id} ({run_name})")
-        mlflow.log_dict(config.model_dump(), "config.json")
+    # Uploads that nothing downstream depends on run on a background thread
+    # pool, overlapping with training, evaluation and model logging. They are
+    # waited for (and their errors raised) before the run is closed.
+    with mlflow.start_run(run_name=run_name) as run, ThreadPoolExecutor(max_workers=4) as io_pool:
+        run_id = run.info.run_id
+        logger.info(f"Started MLflow run: {run_id} ({run_name})")
+        uploads = [io_pool.submit(mlflow.log_dict, config.model_dump(), "config.json", run_id=run_id)]
 
         # --- Step 1: Data Loading and Splitting ---
         logger.info("--- Loading and Splitting Data ---")
         data_loader = DataLoader(config.data_loader)
-        raw_data = data_loader.load_data()
-        X = raw_data.drop(columns=[config.training.target_column])
-        y = raw_data[config.training.target_column]
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y,
+        X_train, X_test, y_train, y_test = data_loader.load_split(
+            config.training.target_column,
             test_size=config.training.test_size,
             random_state=config.training.random_state,
-            stratify=y if config.training.stratify else None
+            stratify=config.training.stratify
         )
         logger.info(f"Data split complete. Train shape: {X_train.shape}, Test shape: {X_test.shape}")
 
@@ -68,14 +109,15 @@ def main():
         logger.info("--- Training Model ---")
         model = train_model(X_train, y_train, config)
 
-        # --- Step 3: Log Metadata ---
-        logger.info("--- Logging Metadata ---")
+        # --- Step 3: Collect Metadata ---
+        # Logged together with the evaluation artifacts in one upload below
+        logger.info("--- Collecting Metadata ---")
+        artifacts = {}
         try:
             preprocessor = model._sklearn_pipeline['preprocessor']
-            metadata = preprocessor.get_metadata()
-            mlflow.log_dict([m.model_dump() for m in metadata], "preprocessor_metadata.json")
+            artifacts["preprocessor_metadata.json"] = preprocessor.get_metadata_dicts()
         except Exception as e:
-            logger.warning(f"Could not log preprocessor metadata: {e}")
+            logger.warning(f"Could not collect preprocessor metadata: {e}")
 
         # --- Step 4: Evaluate Model ---
         logger.info("--- Evaluating Model ---")
@@ -86,28 +128,34 @@ def main():
             metrics_to_compute=config.evaluation.metrics
         )
         logger.info(f"Evaluation results: {evaluation_results['metrics']}")
-        mlflow.log_metrics(evaluation_results["metrics"])
-        for name, content in evaluation_results["artifacts"].items():
-            mlflow.log_dict(content, name)
+        artifacts.update(evaluation_results["artifacts"])
+        uploads.append(io_pool.submit(mlflow.log_metrics, evaluation_results["metrics"], run_id=run_id))
+        uploads.append(io_pool.submit(log_dict_artifacts, artifacts, run_id=run_id))
 
         # --- Step 5: Log Final Model ---
         logger.info("--- Logging Final Model to MLflow ---")
+        # The signature reuses the predictions made during evaluation; only
+        # the schemas of the two samples matter, not that their rows match.
+        # No input_example is passed: MLflow would reload the saved model and
+        # predict on it again just to validate the example.
         input_sample = X_test.head()
-        signature = infer_signature(
-            model_input=input_sample,
-            model_output=model.predict(None, input_sample)
-        )
+        output_sample = evaluation_results["head_predictions"]
+        if output_sample.empty:
+            output_sample = model.predict(None, input_sample)
+        signature = infer_signature(model_input=input_sample, model_output=output_sample)
 
         mlflow.pyfunc.log_model(
             name="model",
             python_model=model,
             code_paths=["src"],
             registered_model_name=config.mlflow.registered_model_name,
-            signature=signature,
-            input_example=input_sample
+            signature=signature
         )
 
-        logger.info(f"Pipeline run completed successfully. Run ID: {run.info.run_id}")
+        for upload in uploads:
+            upload.result()
+
+        logger.info(f"Pipeline run completed successfully. Run ID: {run_id}")
 
 if __name__ == "__main__":
     try: